@@ -0,0 +1,3 @@
+# Автоматизация загрузки расписания из Excel в Barco SMS.
+# Импорт пакета ничего не запускает; вход — barco_automation.cli.main
+# (python -m barco_automation {parse,validate,run,bench}).
@@ -0,0 +1,118 @@
+# Клиент API планировщика для run --backend api: пул соединений с куками сессии, полученной
+# обычным входом в браузере. Пути, тела запросов и поля ответов — контракт mock_server, а не снятый
+# API Barco SMS, поэтому клиент отказывается работать с сервером, который не заглушка.
+
+from urllib.parse import urlencode
+import json
+import logging
+
+import urllib3
+from urllib3.util import Retry, Timeout
+
+from .config import API_POOL_SIZE, API_TIMEOUT_SEC
+from .mock_server import MOCK_API_ENDPOINTS, MOCK_HEADER
+
+
+log = logging.getLogger(__name__)
+
+# У серверов Barco самоподписанный сертификат (в браузере это страница «Подробно»/«Продолжить»).
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+class SmsApiError(RuntimeError):
+    def __init__(self, method, path, status, body):
+        super().__init__(f"{method} {path}: HTTP {status} {body[:200]}")
+        self.status = status
+
+
+class SmsApiClient:
+    def __init__(self, base_url, cookies=None):
+        self.base_url = base_url.rstrip("/")
+        self.endpoints = MOCK_API_ENDPOINTS
+        self.cookies = dict(cookies or {})
+        pool_kw = {"cert_reqs": "CERT_NONE"} if self.base_url.startswith("https") else {}
+        # Повторяем только обрывы соединения и 502-504; POST по умолчанию не повторяется,
+        # чтобы не создать показ дважды.
+        self.pool = urllib3.connection_from_url(
+            self.base_url,
+            maxsize=API_POOL_SIZE,
+            block=True,
+            timeout=Timeout(connect=API_TIMEOUT_SEC, read=API_TIMEOUT_SEC),
+            retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False),
+            **pool_kw,
+        )
+        self.requests = 0
+
+    @classmethod
+    def from_driver(cls, driver, base_url):
+        # Куки сессии после входа через loginUsername/loginPass/loginSubmit.
+        return cls(base_url, {c["name"]: c["value"] for c in driver.get_cookies()})
+
+    def ensure_mock(self):
+        # Один GET главной страницы без кук: настоящему серверу не уходит ни одного запроса API.
+        response = self.pool.urlopen("GET", "/", retries=False)
+        if response.headers.get(MOCK_HEADER) != "1":
+            raise RuntimeError(f"--backend api работает только с mock_server, {self.base_url} — не заглушка")
+
+    def _request(self, method, name, payload=None, query=None, **path_args):
+        path = self.endpoints[name].format(**path_args)
+        url = path + (f"?{urlencode(query)}" if query else "")
+        headers = {"Accept": "application/json"}
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+        body = None
+        if payload is not None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            headers["Content-Type"] = "application/json; charset=utf-8"
+        self.requests += 1
+        response = self.pool.urlopen(method, url, body=body, headers=headers)
+        self._remember_cookies(response)
+        text = response.data.decode("utf-8", errors="replace")
+        if response.status >= 400:
+            raise SmsApiError(method, path, response.status, text)
+        return json.loads(text) if text else None
+
+    def _remember_cookies(self, response):
+        for header in response.headers.getlist("Set-Cookie"):
+            name, _, value = header.split(";", 1)[0].strip().partition("=")
+            if name:
+                self.cookies[name] = value
+
+    def login(self, username, password):
+        self._request("POST", "login", {"username": username, "password": password})
+
+    def authenticated(self):
+        try:
+            return bool((self._request("GET", "session") or {}).get("authenticated"))
+        except SmsApiError:
+            return False
+
+    def catalogue(self):
+        # [{title, duration}]; сервер может отдавать и просто список названий.
+        films = []
+        for film in self._request("GET", "catalogue") or []:
+            if isinstance(film, dict):
+                films.append({"title": film["title"], "duration": film.get("duration")})
+            else:
+                films.append({"title": str(film), "duration": None})
+        return films
+
+    def list_shows(self, date):
+        return self._request("GET", "shows", query={"date": date}) or []
+
+    def create_show(self, date, start, title):
+        return self._request("POST", "shows", {"date": date, "start": start, "title": title})
+
+    def move_show(self, show_id, date, start):
+        return self._request("PUT", "show", {"date": date, "start": start}, id=show_id)
+
+    def close(self):
+        self.pool.close()
+
+
+def ensure_mock_server(base_url):
+    client = SmsApiClient(base_url)
+    try:
+        client.ensure_mock()
+    finally:
+        client.close()
@@ -0,0 +1,127 @@
+# Снимки экрана и DOM при ошибках. В потоке драйвера — только захват (JPEG делает сам Chrome
+# через CDP), а декодирование, хеш, сжатие и запись на диск — в фоновом потоке.
+# Одинаковые снимки не пишутся повторно, на диске остаются последние ARTIFACT_RING_SIZE ошибок.
+
+from collections import Counter, deque
+from datetime import datetime
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import queue
+import re
+import threading
+
+from .config import ARTIFACT_QUEUE_SIZE, ARTIFACT_RING_SIZE, SCREENSHOT_JPEG_QUALITY
+
+
+log = logging.getLogger(__name__)
+
+
+class ArtifactWriter:
+    def __init__(self, run_id, directory, ring_size=ARTIFACT_RING_SIZE):
+        self.run_id = run_id
+        self.directory = directory
+        self.ring = deque()
+        self.ring_size = ring_size
+        self.seen = {}
+        # Сколько записей кольца ссылаются на файл: общий снимок удаляется с последней из них.
+        self.refs = Counter()
+        self.seq = 0
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=ARTIFACT_QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._work, name="artifacts", daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        # Очередь полна — снимок теряем, но запуск не ждёт диска.
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._write(item)
+            except Exception as e:
+                log.debug(f"Не удалось сохранить снимок ошибки {item.get('step')}: {e}")
+
+    def _store(self, data, suffix, stem, files):
+        # Тот же хеш уже на диске в этом запуске — только ссылка на прежний файл.
+        digest = hashlib.sha1(data).hexdigest()
+        path = self.seen.get(digest)
+        if path is None:
+            path = self.directory / f"{stem}_{digest[:8]}{suffix}"
+            with open(path, "wb") as f:
+                f.write(gzip.compress(data) if suffix.endswith(".gz") else data)
+            self.seen[digest] = path
+        files.append((digest, path))
+        self.refs[digest] += 1
+        return path.name
+
+    def _write(self, item):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.seq += 1
+        stem = f"{self.seq:04d}_{re.sub(r'[^0-9A-Za-zА-Яа-яЁё_-]+', '_', item['step'])}"
+        files = []
+        record = {
+            "ts": item["ts"],
+            "run_id": self.run_id,
+            "step": item["step"],
+            "context": item["context"],
+            "error": item["error"],
+        }
+        if item.get("screenshot"):
+            record["screenshot"] = self._store(base64.b64decode(item["screenshot"]), ".jpg", stem, files)
+        if item.get("dom"):
+            record["dom"] = self._store(item["dom"].encode("utf-8"), ".html.gz", stem, files)
+        with open(self.directory / "index.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if not files:
+            return
+
+        self.ring.append(files)
+        while len(self.ring) > self.ring_size:
+            for digest, path in self.ring.popleft():
+                self.refs[digest] -= 1
+                if self.refs[digest] <= 0:
+                    del self.refs[digest]
+                    del self.seen[digest]
+                    path.unlink(missing_ok=True)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self.dropped:
+            print(f"⚠️ Снимков ошибок пропущено из-за переполнения очереди: {self.dropped}")
+
+
+# Запись снимков текущего запуска; None — снимки выключены.
+ARTIFACTS = None
+
+
+def capture_failure(driver, step, context=None, error=None):
+    if ARTIFACTS is None or driver is None:
+        return
+    item = {
+        "ts": datetime.now().isoformat(timespec="milliseconds"),
+        "step": step,
+        "context": context,
+        "error": str(error) if error is not None else None,
+    }
+    try:
+        item["screenshot"] = driver.execute_cdp_cmd(
+            "Page.captureScreenshot", {"format": "jpeg", "quality": SCREENSHOT_JPEG_QUALITY}
+        )["data"]
+    except Exception as e:
+        log.debug(f"Снимок экрана для {step} не снят: {e}")
+    try:
+        item["dom"] = driver.execute_script("return document.documentElement.outerHTML;")
+    except Exception as e:
+        log.debug(f"DOM для {step} не снят: {e}")
+    ARTIFACTS.submit(item)
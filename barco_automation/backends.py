@@ -0,0 +1,106 @@
+# Как ставятся показы на сервер: кликами в планировщике (ui) или запросами к API mock_server (api).
+# runner работает с обоими одинаково: open_day -> day_shows -> current_block/move/create.
+
+from selenium.webdriver.common.by import By
+
+from .dom import dom_query
+from .logs import log_context, log_exception
+from .timeline import find_day_show, read_day_shows, schedule_show
+from .tracing import trace_span
+from .waits import nth_element_located, wait_step
+
+
+class UiBackend:
+    name = "ui"
+
+    def __init__(self, driver, day_columns, catalogue=None):
+        self.driver = driver
+        self.day_columns = day_columns
+        self.catalogue = catalogue
+        self.column = None
+
+    def open_day(self, date, page):
+        self.column = self.day_columns.goto(page, date)
+        if self.column is not None:
+            dom_query(self.driver, "click", None, ".dayHeader", self.column)
+        return self.column is not None
+
+    def _day_view(self):
+        return wait_step(self.driver, "day_view", nth_element_located((By.CLASS_NAME, "dayView"), self.column))
+
+    def day_shows(self):
+        return read_day_shows(self.driver, self._day_view())
+
+    def current_block(self, block):
+        # Элемент блока мог смениться после перерисовки таймлайна — ищем заново.
+        return find_day_show(self.driver, self._day_view(), block["title"], block["minutes"])
+
+    def move(self, show, block, journal):
+        return schedule_show(self.driver, journal, self.column, show, block=block["el"], catalogue=self.catalogue)
+
+    def create(self, show, journal):
+        return schedule_show(self.driver, journal, self.column, show, catalogue=self.catalogue)
+
+
+class ApiBackend:
+    name = "api"
+
+    def __init__(self, client, catalogue=None):
+        self.client = client
+        self.catalogue = catalogue
+        self.date = None
+
+    def open_day(self, date, page):
+        self.date = date
+        return True
+
+    def day_shows(self):
+        blocks = []
+        for i, item in enumerate(self.client.list_shows(self.date)):
+            hour, minute = item["start"].split(":")
+            blocks.append(
+                {
+                    "index": i,
+                    "title": item["title"],
+                    "minutes": int(hour) * 60 + int(minute),
+                    "duration": item.get("duration"),
+                    "id": item["id"],
+                }
+            )
+        return blocks
+
+    def current_block(self, block):
+        return block
+
+    def _start(self, show):
+        # Пикер минут только в UI: через API время ставится точно как в Excel.
+        hour, minute = show["time"].split(":")
+        return f"{int(hour):02d}:{int(minute):02d}"
+
+    def _title(self, show):
+        match = show.get("match")
+        return match["title"] if match else show["title"]
+
+    def _apply(self, show, journal, state, request):
+        with log_context(show=journal.show_key(show)):
+            with trace_span("show", title=show["title"], date=show["date"], time=show["time"]):
+                try:
+                    result = request()
+                    # Ответ сервера с показом и есть подтверждение: перечитывать день не нужно.
+                    journal.record(show, state, id=(result or {}).get("id"))
+                    journal.record(show, "confirmed")
+                    return True
+                except Exception as e:
+                    log_exception(f"Ошибка API для фильма '{show['title']}' {show['date']} {show['time']}")
+                    journal.record(show, "failed", error=str(e))
+                    return False
+
+    def move(self, show, block, journal):
+        return self._apply(
+            show, journal, "moved", lambda: self.client.move_show(block["id"], show["date"], self._start(show))
+        )
+
+    def create(self, show, journal):
+        return self._apply(
+            show, journal, "created", lambda: self.client.create_show(show["date"], self._start(show), self._title(show))
+        )
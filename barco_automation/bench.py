@@ -0,0 +1,169 @@
+# Нагрузочный прогон автоматизации против локальной заглушки Barco SMS.
+# Для каждого размера синтетического расписания поднимает mock_server,
+# запускает `barco_automation run` (headless) и считает время, вызовы WebDriver
+# на показ и ошибки по фактическому состоянию сервера.
+#
+#   python -m barco_automation bench --sizes 10 100 1000 --latency-ms 30
+
+from datetime import datetime, timedelta
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+from .config import ARTIFACTS_DIR, BASE_DIR, TRACES_DIR
+from .mock_server import start_mock_server, synthetic_films
+
+
+BENCH_DIR = ARTIFACTS_DIR / "bench"
+
+# Неделя, на которую ставятся синтетические показы (понедельник).
+BENCH_WEEK_START = datetime(2030, 1, 7)
+BENCH_FILMS = 50
+# Шаг между показами в дне; кратен шагу пикера минут (3).
+BENCH_SLOT_MINUTES = 9
+
+
+def synthetic_schedule(size, films):
+    # Показы по кругу раскладываются на 7 дней недели, внутри дня — с шагом BENCH_SLOT_MINUTES.
+    schedule = []
+    for i in range(size):
+        day = BENCH_WEEK_START + timedelta(days=i % 7)
+        minutes = (i // 7) * BENCH_SLOT_MINUTES
+        if minutes >= 24 * 60:
+            raise ValueError(f"{size} показов не помещаются в неделю с шагом {BENCH_SLOT_MINUTES} мин")
+        schedule.append(
+            {
+                "date": day.strftime("%d.%m.%Y"),
+                "time": f"{minutes // 60:02d}:{minutes % 60:02d}",
+                "title": films[i % len(films)]["title"],
+            }
+        )
+    return schedule
+
+
+def count_failures(schedule, server_shows):
+    # Показ засчитан, если на сервере есть тот же фильм в тот же день не дальше шага пикера.
+    placed = {}
+    for show in server_shows:
+        hour, minute = show["start"].split(":")
+        placed.setdefault((show["date"], show["title"]), []).append(int(hour) * 60 + int(minute))
+    failures = 0
+    for item in schedule:
+        hour, minute = item["time"].split(":")
+        target = int(hour) * 60 + int(minute)
+        starts = placed.get((item["date"], item["title"]), [])
+        match = next((s for s in starts if abs(s - target) <= 3), None)
+        if match is None:
+            failures += 1
+        else:
+            starts.remove(match)
+    extra = sum(len(v) for v in placed.values())
+    return failures, extra
+
+
+def run_once(url, schedule_path, run_id, extra_args):
+    command = [
+        sys.executable,
+        "-m",
+        "barco_automation",
+        "run",
+        "--target",
+        f"bench={url}",
+        "--schedule-json",
+        str(schedule_path),
+        "--run-id",
+        run_id,
+        "--headless",
+        *extra_args,
+    ]
+    started = time.monotonic()
+    completed = subprocess.run(
+        command, cwd=BASE_DIR, capture_output=True, text=True, encoding="utf-8", errors="replace"
+    )
+    seconds = time.monotonic() - started
+    summary_path = TRACES_DIR / f"summary_{run_id}.json"
+    summary = {}
+    if summary_path.exists():
+        with open(summary_path, "r", encoding="utf-8") as f:
+            summary = json.load(f)
+    return seconds, completed.returncode, summary, completed.stdout[-2000:] + completed.stderr[-2000:]
+
+
+def bench_size(size, latency_ms, rerun, extra_args):
+    films = synthetic_films(BENCH_FILMS)
+    schedule = synthetic_schedule(size, films)
+    server, url = start_mock_server(latency_ms=latency_ms, films=films, week_start=BENCH_WEEK_START)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    schedule_path = BENCH_DIR / f"schedule_{size}_{stamp}.json"
+    with open(schedule_path, "w", encoding="utf-8") as f:
+        json.dump(schedule, f, ensure_ascii=False)
+
+    results = []
+    passes = ["first", "rerun"] if rerun else ["first"]
+    try:
+        for name in passes:
+            run_id = f"bench-{size}-{name}-{stamp}"
+            seconds, returncode, summary, tail = run_once(url, schedule_path, run_id, extra_args)
+            failures, extra = count_failures(schedule, server.state.list_shows())
+            # Все вызовы запуска по потокам, а не сумма фаз: часть вызовов показа идёт вне вложенных фаз.
+            calls = summary.get("webdriver_calls", 0)
+            results.append(
+                {
+                    "size": size,
+                    "pass": name,
+                    "latency_ms": latency_ms,
+                    "seconds": round(seconds, 2),
+                    "seconds_per_show": round(seconds / size, 3),
+                    "webdriver_calls_per_show": round(calls / size, 1),
+                    "server_requests": server.state.requests,
+                    "failures": failures,
+                    "extra_on_server": extra,
+                    "returncode": returncode,
+                    "phases": summary.get("phases", {}),
+                }
+            )
+            if returncode != 0:
+                print(f"❗ Прогон {run_id} завершился с кодом {returncode}:\n{tail}")
+    finally:
+        server.shutdown()
+    return results
+
+
+def print_results(results):
+    print(f"\n{'показов':>8}{'проход':>8}{'сек':>10}{'сек/показ':>11}{'WD/показ':>10}{'ошибок':>8}{'лишних':>8}")
+    for r in results:
+        print(
+            f"{r['size']:>8}{r['pass']:>8}{r['seconds']:>10.1f}{r['seconds_per_show']:>11.3f}"
+            f"{r['webdriver_calls_per_show']:>10.1f}{r['failures']:>8}{r['extra_on_server']:>8}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="barco_automation bench",
+        description="Бенчмарк автоматизации против mock Barco SMS",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--latency-ms", type=int, default=30, help="задержка ответа API заглушки, мс")
+    parser.add_argument("--rerun", action="store_true", help="второй проход по тому же расписанию (сверка)")
+    parser.add_argument("script_args", nargs=argparse.REMAINDER, help="доп. аргументы для run после --")
+    args = parser.parse_args(argv)
+    extra_args = [a for a in args.script_args if a != "--"]
+
+    BENCH_DIR.mkdir(parents=True, exist_ok=True)
+    results = []
+    for size in args.sizes:
+        print(f"▶ {size} показов, задержка {args.latency_ms} мс")
+        results.extend(bench_size(size, args.latency_ms, args.rerun, extra_args))
+
+    print_results(results)
+    report_path = BENCH_DIR / f"bench_{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"Отчёт: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# Запуск Chrome/chromedriver и вход в Barco SMS.
+
+from datetime import datetime
+from pathlib import Path
+import json
+import logging
+import os
+import re
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from .config import DRIVER_CACHE_PATH, HEADLESS_WINDOW_SIZE, SMS_PASSWORD, SMS_USERNAME
+from .network import enable_performance_log, network_mark, wait_network_idle
+from .waits import wait_step
+
+
+log = logging.getLogger(__name__)
+
+
+def build_chrome_options(browser, target):
+    options = Options()
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    enable_performance_log(options)
+    if browser.get("headless"):
+        # Облегчённый профиль для ночных запусков без окна.
+        width, height = HEADLESS_WINDOW_SIZE
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={width},{height}")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--mute-audio")
+        options.page_load_strategy = "eager"
+    else:
+        options.add_argument("--start-maximized")
+    if browser.get("debugger_address"):
+        # Подключаемся к уже запущенному Chrome (--remote-debugging-port).
+        options.debugger_address = browser["debugger_address"]
+    elif browser.get("profile_root"):
+        # Свой профиль на каждый сервер: куки логина переживают перезапуск.
+        profile_dir = Path(browser["profile_root"]) / re.sub(r'[\\/:*?"<>|\s]+', "_", target["name"])
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    return options
+
+
+def _cached_driver_path():
+    try:
+        with open(DRIVER_CACHE_PATH, "r", encoding="utf-8") as f:
+            path = Path(json.load(f)["path"])
+    except Exception:
+        return None
+    return path if path.exists() else None
+
+
+def _remember_driver_path(driver):
+    try:
+        with open(DRIVER_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "path": driver.service.path,
+                    "browser_version": driver.capabilities.get("browserVersion"),
+                    "saved": datetime.now().isoformat(timespec="seconds"),
+                },
+                f,
+                ensure_ascii=False,
+            )
+    except Exception as e:
+        print(f"⚠️ Не удалось сохранить путь к ChromeDriver: {e}")
+
+
+def start_driver(options):
+    driver = None
+    env_driver_path = os.getenv("CHROMEDRIVER_PATH")
+    fallback_driver_paths = [
+        Path(r"C:\Users\Ust-Kinel\Desktop\autometization\chromedriver-win64\chromedriver.exe"),
+        Path("/opt/homebrew/bin/chromedriver"),
+    ]
+
+    if env_driver_path:
+        fallback_driver_paths.insert(0, Path(env_driver_path))
+
+    # Драйвер, найденный Selenium Manager в прошлый раз, — без повторного поиска.
+    cached_path = _cached_driver_path()
+    if cached_path:
+        try:
+            driver = webdriver.Chrome(service=Service(str(cached_path)), options=options)
+            print(f"✅ Chrome запущен с сохранённым ChromeDriver: {cached_path}")
+            return driver
+        except Exception as e:
+            print(f"⚠️ Сохранённый ChromeDriver не подошёл ({cached_path}): {e}")
+            DRIVER_CACHE_PATH.unlink(missing_ok=True)
+
+    try:
+        # Selenium Manager подбирает совместимый драйвер под текущий Chrome.
+        print("Пробуем запуск Chrome через Selenium Manager (автоподбор драйвера)...")
+        driver = webdriver.Chrome(options=options)
+        print("✅ Chrome запущен через Selenium Manager.")
+        _remember_driver_path(driver)
+    except Exception as e:
+        print(f"⚠️ Selenium Manager не сработал: {e}")
+        for candidate in fallback_driver_paths:
+            if not candidate.exists():
+                continue
+            try:
+                log.debug(f"Пробуем локальный ChromeDriver: {candidate}")
+                driver = webdriver.Chrome(service=Service(str(candidate)), options=options)
+                print(f"✅ Chrome запущен с локальным ChromeDriver: {candidate}")
+                break
+            except Exception as fallback_error:
+                print(f"⚠️ Не удалось запустить через {candidate}: {fallback_error}")
+
+    if driver is None:
+        raise RuntimeError(
+            "Не удалось запустить Chrome. Обновите ChromeDriver до версии вашего Chrome "
+            "или задайте корректный путь в переменной CHROMEDRIVER_PATH."
+        )
+    return driver
+
+
+def close_driver(driver, browser):
+    if browser.get("debugger_address"):
+        # Чужой долгоживущий Chrome не закрываем — только отключаем chromedriver.
+        driver.service.stop()
+    else:
+        driver.quit()
+
+
+def page_state(driver):
+    # Что сейчас на странице: планировщик, логин или страница сертификата.
+    return driver.execute_script(
+        """
+if (document.querySelector('.dayHeader')) return 'scheduler';
+const login = document.getElementById('loginUsername');
+if (login && login.offsetParent !== null) return 'login';
+if (document.getElementById('details-button')) return 'interstitial';
+return null;
+"""
+    )
+
+
+def open_scheduler(driver, base_url):
+    scheduler_url = f"{base_url}/#sms/scheduler"
+    if driver.current_url.startswith(scheduler_url) and page_state(driver) == "scheduler":
+        print("♻️ Планировщик уже открыт и авторизован, логин пропускаем")
+    else:
+        driver.get(scheduler_url)
+        state = wait_step(driver, "page_state", page_state)
+
+        if state == "interstitial":
+            # Ждем и нажимаем кнопку "Подробно" (details-button), затем "Продолжить" (proceed-link)
+            wait_step(driver, "page_state", EC.element_to_be_clickable((By.ID, "details-button"))).click()
+            wait_step(driver, "page_state", EC.element_to_be_clickable((By.ID, "proceed-link"))).click()
+            state = wait_step(driver, "page_state", page_state)
+
+        if state == "login":
+            driver.find_element(By.ID, "loginUsername").send_keys(SMS_USERNAME)
+            driver.find_element(By.ID, "loginPass").send_keys(SMS_PASSWORD)
+            mark = network_mark(driver)
+            wait_step(driver, "login", EC.element_to_be_clickable((By.ID, "loginSubmit"))).click()
+            wait_network_idle(driver, "network_login", mark)
+            wait_step(driver, "login", EC.invisibility_of_element_located((By.ID, "loginUsername")))
+            print("✅ Вход выполнен")
+            driver.get(scheduler_url)
+            state = wait_step(driver, "page_state", page_state)
+            # Показы и каталог страница догружает запросами уже после отрисовки заголовков.
+            wait_network_idle(driver, "network_login", mark)
+        else:
+            print("♻️ Сессия уже авторизована, логин пропускаем")
+
+        if state != "scheduler":
+            raise RuntimeError(f"Планировщик не открылся, состояние страницы: {state}")
+
+    try:
+        lock_app = wait_step(driver, "lock_app", EC.presence_of_element_located((By.ID, "lockApp")))
+        if "lockAppRed" in lock_app.get_attribute("class"):
+            lock_app.click()
+            print("Кнопка с lockAppRed найдена и нажата.")
+        else:
+            print("Кнопка есть но класс lockAppRed отсутсвует - не нажимаем")
+    except Exception as e:
+        print(f"Ошибка при проверке lockApp: {e}")
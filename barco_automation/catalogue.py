@@ -0,0 +1,152 @@
+# Каталог фильмов сервера (listOfShows) с кешем на диске.
+
+from datetime import datetime
+import hashlib
+import json
+import os
+import threading
+
+from selenium.common.exceptions import TimeoutException
+
+from .config import CATALOGUE_PATH
+from .dom import dom_query
+from .titles import title_index_for
+from .waits import wait_step
+
+
+def catalogue_hash(titles):
+    return hashlib.sha1("\n".join(titles).encode("utf-8")).hexdigest()
+
+
+class ShowCatalogue:
+    # Каталог фильмов сервера (строки listOfShows) с хешем содержимого.
+    # Хранится на диске по имени сервера и переиспользуется между показами и запусками.
+    _lock = threading.Lock()
+
+    def __init__(self, target, titles=(), saved_hash=None, durations=None):
+        self.target = target
+        self.titles = list(titles)
+        self.hash = saved_hash or catalogue_hash(self.titles)
+        self.index = title_index_for(self.titles)
+        # Длительность фильма в минутах по названию из каталога, если сервер её отдаёт.
+        self.durations = dict(durations or {})
+        # True — каталог только из кеша, с сервером в этом запуске не сверен.
+        self.stale = False
+
+    def __len__(self):
+        return len(self.titles)
+
+    @classmethod
+    def _read_all(cls):
+        try:
+            with open(CATALOGUE_PATH, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    @classmethod
+    def load(cls, target):
+        entry = cls._read_all().get(target) or {}
+        titles = entry.get("titles") or []
+        # Битая запись (не сходится хеш или длина) — как будто каталога нет.
+        if len(titles) != entry.get("count") or catalogue_hash(titles) != entry.get("hash"):
+            titles = []
+        return cls(target, titles, durations=entry.get("durations") if titles else None)
+
+    def save(self):
+        with self._lock:
+            data = self._read_all()
+            data[self.target] = {
+                "hash": self.hash,
+                "count": len(self.titles),
+                "titles": self.titles,
+                "durations": self.durations,
+                "saved": datetime.now().isoformat(timespec="seconds"),
+            }
+            tmp_path = CATALOGUE_PATH.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, CATALOGUE_PATH)
+
+    def refresh(self, titles, durations=None):
+        # True, если каталог поменялся (длина или хеш) и индекс пересобран.
+        # durations без списка названий не сбрасываются: список из поповера их не знает.
+        titles = list(titles)
+        self.stale = False
+        new_hash = catalogue_hash(titles)
+        durations_changed = durations is not None and durations != self.durations
+        if durations_changed:
+            self.durations = dict(durations)
+        if len(titles) == len(self.titles) and new_hash == self.hash:
+            if durations_changed:
+                self._save_quietly()
+            return False
+        self.titles = titles
+        self.hash = new_hash
+        self.index = title_index_for(titles)
+        self._save_quietly()
+        return True
+
+    def _save_quietly(self):
+        try:
+            self.save()
+        except Exception as e:
+            print(f"⚠️ Не удалось сохранить каталог фильмов: {e}")
+
+    def match(self, title):
+        return self.index.match(title)
+
+    def duration(self, title):
+        return self.durations.get(title)
+
+
+def scrape_show_catalogue(driver):
+    # Весь listOfShows одним вызовом; список есть в DOM и пока поповер закрыт.
+    # Длительность — из data-duration строки, если планировщик её ставит.
+    return [
+        {"title": row["text"], "duration": row.get("duration")}
+        for row in dom_query(driver, "scan", "#listOfShows", "a")
+    ]
+
+
+def scrape_show_catalogue_opened(driver):
+    # listOfShows пуст, пока его не раскрыли: один раз жмём caretBtn (как перед выбором фильма),
+    # читаем строки и сворачиваем список обратно.
+    if not dom_query(driver, "click", None, ".caretBtn", 0):
+        return []
+    try:
+        return wait_step(driver, "list_of_shows", lambda d: scrape_show_catalogue(d) or False)
+    except TimeoutException:
+        return []
+    finally:
+        dom_query(driver, "click", None, ".caretBtn", 0)
+
+
+def film_durations(films):
+    durations = {}
+    for film in films:
+        try:
+            durations[film["title"]] = int(film["duration"])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return durations
+
+
+def load_show_catalogue(driver, target_name, films=None):
+    # films — готовый список {title, duration} (например, из API); иначе читаем listOfShows на странице.
+    catalogue = ShowCatalogue.load(target_name)
+    cached = len(catalogue)
+    if films is None:
+        films = scrape_show_catalogue(driver) or scrape_show_catalogue_opened(driver)
+    titles = [film["title"] for film in films]
+    if titles and catalogue.refresh(titles, film_durations(films)):
+        print(f"📚 [{target_name}] Каталог фильмов обновлён: {len(catalogue)} (в кеше было {cached})")
+    elif titles:
+        print(f"📚 [{target_name}] Каталог фильмов не изменился: {len(catalogue)}")
+    elif catalogue.titles:
+        # Новые фильмы сервера в кеше не появятся: по нему не отбраковываем, сверим в поповере.
+        catalogue.stale = True
+        print(f"⚠️ [{target_name}] Список фильмов не прочитан, каталог из кеша ({cached}) не сверен с сервером")
+    else:
+        print(f"⚠️ [{target_name}] Каталог фильмов пуст, соберём его при первом открытии списка")
+    return catalogue
@@ -0,0 +1,258 @@
+# Точка входа: подкоманды parse, validate, run, bench.
+# pandas и selenium импортируются только теми подкомандами, которым они нужны.
+
+from datetime import datetime
+from pathlib import Path
+import argparse
+import sys
+
+from .config import (
+    CHROME_PROFILES_DIR,
+    HEADLESS_WINDOW_SIZE,
+    MAX_PARALLEL_TARGETS,
+    SCHEDULE_BACKEND,
+    SCHEDULE_JSON_PATH,
+    SCREENSHOTS_DIR,
+    TRACES_DIR,
+    ensure_artifact_dirs,
+)
+
+
+COMMANDS = ("parse", "validate", "run", "bench")
+
+
+def _add_schedule_arguments(parser):
+    parser.add_argument(
+        "--excel",
+        type=Path,
+        action="append",
+        help="книга Excel с расписанием, можно несколько (по умолчанию все 'Рассписание*.xlsx' в папке проекта)",
+    )
+    parser.add_argument(
+        "--schedule-json",
+        type=Path,
+        help="взять готовое расписание из JSON (как schedule.json) вместо Excel",
+    )
+
+
+def _add_target_arguments(parser):
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        metavar="ЗАЛ=URL",
+        help="сервер Barco SMS для зала (можно указать несколько раз)",
+    )
+    parser.add_argument(
+        "--targets-file",
+        type=Path,
+        help='JSON с соответствием зал -> URL, например {"Зал 1": "https://192.168.100.2:43744"}',
+    )
+
+
+def _add_run_arguments(parser):
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="продолжить прошлый запуск: пропустить показы, подтверждённые в журнале",
+    )
+    parser.add_argument(
+        "--run-id",
+        default=datetime.now().strftime("%Y%m%d-%H%M%S"),
+        help="идентификатор запуска в журнале и трассировке",
+    )
+    parser.add_argument(
+        "--debugger-address",
+        metavar="HOST:PORT",
+        help="подключиться к уже открытому Chrome (запущен с --remote-debugging-port)",
+    )
+    parser.add_argument(
+        "--persist-session",
+        action="store_true",
+        help=f"хранить профиль Chrome с куками логина в {CHROME_PROFILES_DIR}",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help=f"без окна, окно {HEADLESS_WINDOW_SIZE[0]}x{HEADLESS_WINDOW_SIZE[1]}, без картинок, расширений и GPU",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_PARALLEL_TARGETS,
+        help="сколько серверов обрабатывать одновременно",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("ui", "api"),
+        default=SCHEDULE_BACKEND,
+        help="ui — кликами в планировщике; api — после входа в браузере запросами к API, только для "
+        "mock_server (по умолчанию BARCO_BACKEND или ui)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="только войти, собрать план и показать ошибки, ничего не меняя в расписании",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=("DEBUG", "INFO", "WARNING", "ERROR"),
+        type=str.upper,
+        help="уровень журнала (по умолчанию BARCO_LOG_LEVEL или INFO); DEBUG — пошаговые сообщения UI",
+    )
+    parser.add_argument(
+        "--deadline-min",
+        type=float,
+        metavar="МИН",
+        help="общий лимит времени запуска: по истечении новые показы не начинаются, остальное — через --resume",
+    )
+    parser.add_argument(
+        "--no-json-export",
+        action="store_true",
+        help=f"не сохранять разобранное расписание в {SCHEDULE_JSON_PATH.name}",
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="barco_automation",
+        description="Загрузка расписания из Excel в Barco SMS",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="{parse,validate,run,bench}")
+
+    parse = commands.add_parser("parse", help="разобрать Excel и сохранить расписание в JSON")
+    parse.add_argument("--excel", type=Path, action="append", help="книга Excel с расписанием, можно несколько")
+    parse.add_argument(
+        "--output",
+        type=Path,
+        default=SCHEDULE_JSON_PATH,
+        help=f"куда сохранить расписание (по умолчанию {SCHEDULE_JSON_PATH})",
+    )
+    parse.add_argument("--no-cache", action="store_true", help="разобрать Excel заново, не глядя в кеш")
+
+    validate = commands.add_parser(
+        "validate",
+        help="проверить даты, время и названия по сохранённому каталогу фильмов, без браузера",
+    )
+    _add_schedule_arguments(validate)
+    _add_target_arguments(validate)
+
+    run = commands.add_parser("run", help="загрузить расписание в Barco SMS (по умолчанию)")
+    _add_schedule_arguments(run)
+    _add_target_arguments(run)
+    _add_run_arguments(run)
+
+    commands.add_parser("bench", help="бенчмарк против mock Barco SMS (аргументы: bench --help)", add_help=False)
+    return parser
+
+
+def _excel_paths(args):
+    from .excel import find_excel_files
+
+    excel_paths = args.excel or find_excel_files()
+    print(f"Excel для загрузки: {', '.join(str(path) for path in excel_paths)}")
+    return excel_paths
+
+
+def cmd_parse(args):
+    from .excel import read_schedule
+
+    read_schedule(_excel_paths(args), export_path=args.output, use_cache=not args.no_cache)
+    return 0
+
+
+def cmd_validate(args):
+    from .catalogue import ShowCatalogue
+    from .conflicts import print_conflicts, schedule_conflicts
+    from .excel import read_schedule
+    from .plan import RunPlan
+    from .targets import hall_target_errors, load_targets, schedule_for_target
+
+    if args.schedule_json:
+        schedule = read_schedule(json_path=args.schedule_json)
+    else:
+        schedule = read_schedule(_excel_paths(args))
+
+    targets = load_targets(args)
+    hall_errors = hall_target_errors(schedule, targets)
+    for error in hall_errors:
+        print(f"❌ {error}")
+    failures = len(hall_errors)
+    for target in targets:
+        catalogue = ShowCatalogue.load(target["name"])
+        if not len(catalogue):
+            print(f"⚠️ [{target['name']}] Каталог фильмов не сохранён, названия не проверены (нужен run --dry-run)")
+        plan = RunPlan.build(target["name"], schedule_for_target(schedule, target), catalogue=catalogue)
+        plan.print_report()
+        conflicts, unknown = schedule_conflicts(plan.entries, catalogue)
+        print_conflicts(target["name"], conflicts, unknown)
+        failures += len(plan.failures) + sum(1 for c in conflicts if c["kind"] == "overlap")
+    return 1 if failures else 0
+
+
+def cmd_run(args):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from . import artifacts, tracing
+    from .excel import read_schedule
+    from .logs import LOG_LEVEL, setup_run_log
+    from .network import REQUEST_STATS
+    from .retry import RETRY_STATS, set_run_deadline
+    from .runner import print_target_summaries, run_targets
+    from .targets import hall_target_errors, load_targets
+
+    run_id = args.run_id
+    setup_run_log(run_id, args.log_level or LOG_LEVEL)
+    tracing.TRACER = tracing.RunTracer(run_id, TRACES_DIR / f"trace_{run_id}.jsonl")
+    artifacts.ARTIFACTS = artifacts.ArtifactWriter(run_id, SCREENSHOTS_DIR / run_id)
+    set_run_deadline(args.deadline_min * 60 if args.deadline_min else None)
+    targets = load_targets(args)
+    if args.debugger_address and len(targets) > 1:
+        raise SystemExit("--debugger-address подключает один Chrome, укажите один сервер")
+    browser = {
+        "debugger_address": args.debugger_address,
+        "profile_root": CHROME_PROFILES_DIR if args.persist_session else None,
+        "headless": args.headless,
+    }
+
+    excel_paths = None if args.schedule_json else _excel_paths(args)
+    export_path = None if args.no_json_export else SCHEDULE_JSON_PATH
+
+    # Excel разбирается в фоне, пока запускается Chrome и идёт вход на серверы.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="schedule") as loader:
+        schedule_future = loader.submit(read_schedule, excel_paths, args.schedule_json, export_path)
+        summaries = run_targets(
+            targets, schedule_future, args.workers, args.resume, browser, run_id, args.dry_run, args.backend
+        )
+    print_target_summaries(summaries)
+    tracing.TRACER.print_summary()
+    tracing.TRACER.close()
+    artifacts.ARTIFACTS.close()
+    RETRY_STATS.print_report()
+    RETRY_STATS.write(TRACES_DIR / f"retries_{run_id}.json")
+    REQUEST_STATS.print_report()
+    REQUEST_STATS.write(TRACES_DIR / f"requests_{run_id}.json")
+    # Ошибку разбора показываем целиком, а не только в итогах серверов.
+    hall_errors = hall_target_errors(schedule_future.result(), targets)
+    for error in hall_errors:
+        print(f"❌ {error}")
+    # Ненулевой код, если хоть один сервер упал или хоть один показ не поставлен.
+    failed = hall_errors or any(s["error"] or s["failed"] for s in summaries)
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Без подкоманды — run, как раньше запускался barco_open_chrome.py.
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv.insert(0, "run")
+
+    if argv[0] == "bench":
+        from .bench import main as bench_main
+
+        return bench_main(argv[1:])
+
+    args = build_parser().parse_args(argv)
+    ensure_artifact_dirs()
+    handler = {"parse": cmd_parse, "validate": cmd_validate, "run": cmd_run}[args.command]
+    return handler(args)
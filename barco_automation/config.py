@@ -0,0 +1,97 @@
+# Пути, адреса серверов и настройки шагов автоматизации.
+
+from pathlib import Path
+import os
+
+
+# Корень проекта: рядом лежат Excel с расписанием и папка артефактов.
+BASE_DIR = Path(__file__).resolve().parent.parent
+ARTIFACTS_DIR = BASE_DIR / "automation_artifacts"
+SCREENSHOTS_DIR = ARTIFACTS_DIR / "screenshots"
+LOG_PATH = ARTIFACTS_DIR / "barco_automation.log"
+SCHEDULE_JSON_PATH = ARTIFACTS_DIR / "schedule.json"
+SCHEDULE_CACHE_PATH = ARTIFACTS_DIR / "schedule_cache.json"
+JOURNAL_PATH = ARTIFACTS_DIR / "run_journal.jsonl"
+DRIVER_CACHE_PATH = ARTIFACTS_DIR / "chromedriver_cache.json"
+CHROME_PROFILES_DIR = ARTIFACTS_DIR / "chrome_profiles"
+TRACES_DIR = ARTIFACTS_DIR / "traces"
+CATALOGUE_PATH = ARTIFACTS_DIR / "show_catalogue.json"
+# Соответствие листов/книг Excel залам (серверам), если имена листов не совпадают с именами залов.
+HALLS_PATH = Path(os.getenv("BARCO_HALLS", BASE_DIR / "halls.json"))
+# Фиксированный размер окна для headless: координатные клики считаются от него.
+HEADLESS_WINDOW_SIZE = (1920, 1080)
+
+DEFAULT_BASE_URL = os.getenv("BARCO_URL", "https://192.168.100.2:43744")
+SMS_USERNAME = os.getenv("BARCO_USERNAME", "admin")
+SMS_PASSWORD = os.getenv("BARCO_PASSWORD", "Admin1234")
+MAX_PARALLEL_TARGETS = 4
+# Увеличивать при любом изменении правил разбора, чтобы сбросить кеш.
+SCHEDULE_PARSER_VERSION = 3
+TITLE_SUFFIX_PATTERN = r"\s+\d+D|,\s*\d+\+?"
+# Буква столбца Excel с длительностью фильма в минутах (например, C); без неё — из каталога сервера.
+SCHEDULE_DURATION_COLUMN = os.getenv("BARCO_DURATION_COLUMN") or None
+# Минимальный перерыв между показами в зале на уборку, мин.
+CLEANING_MINUTES = int(os.getenv("BARCO_CLEANING_MIN", "15"))
+
+# Таймауты ожидания (сек) для каждого шага добавления фильма.
+STEP_TIMEOUTS = {
+    "day_view": 10,
+    "hour_line": 10,
+    "popover": 5,
+    "caret": 5,
+    "list_of_shows": 5,
+    "popover_ok": 5,
+    "row_item": 10,
+    "menu_show": 4,
+    "move_to": 4,
+    "datepicker": 10,
+    "timepicker": 5,
+    "confirm": 5,
+    "modal_closed": 15,
+    "page_state": 30,
+    "login": 20,
+    "lock_app": 5,
+    "week": 15,
+    "network_login": 30,
+    "network_popover_ok": 10,
+    "network_confirm": 15,
+}
+DEFAULT_STEP_TIMEOUT = 10
+STEP_POLL_SEC = 0.1
+# Минимальная пауза после каждого шага, чтобы UI успел навесить обработчики.
+SETTLE_DELAY_SEC = float(os.getenv("BARCO_SETTLE_DELAY", "0.2"))
+# direct: создаём показ сразу в нужное время; move: создаём в фиксированном слоте и переносим.
+SCHEDULE_MODE = os.getenv("BARCO_SCHEDULE_MODE", "direct")
+# Сверка с тем, что уже стоит на таймлайне: создаём/переносим только разницу.
+SYNC_ENABLED = os.getenv("BARCO_SYNC", "1") != "0"
+PICKER_MINUTE_STEP = 3
+# Минимальная похожесть названия из Excel и из списка фильмов Barco.
+MIN_TITLE_SCORE = 0.55
+# Ниже этого счёта совпадение только похожее (не то же название и не его часть) — фильм не ставим.
+SURE_TITLE_SCORE = 0.9
+# На сколько недель вперёд/назад от открытой можно листать nextHeader/prevHeader.
+MAX_WEEK_PAGES = 26
+
+# Ожидание ответа сервера по событиям сети из performance-лога Chrome.
+NETWORK_WAIT_ENABLED = os.getenv("BARCO_NETWORK_WAIT", "1") != "0"
+# Сколько сеть должна молчать после последнего ответа, чтобы шаг считался завершённым.
+NETWORK_QUIET_SEC = 0.15
+# Если действие за это время не отправило ни одного запроса — не ждём сеть.
+NETWORK_START_GRACE_SEC = 0.5
+NETWORK_TRACKED_TYPES = ("XHR", "Fetch", "Document")
+
+# ui: показы ставятся кликами в планировщике; api: запросами к API mock_server (только заглушка).
+SCHEDULE_BACKEND = os.getenv("BARCO_BACKEND", "ui")
+API_TIMEOUT_SEC = 10
+API_POOL_SIZE = 4
+
+# Снимки при ошибках: сколько последних держать на диске за запуск и сколько ждут записи.
+ARTIFACT_RING_SIZE = int(os.getenv("BARCO_ARTIFACT_RING", "20"))
+ARTIFACT_QUEUE_SIZE = 50
+SCREENSHOT_JPEG_QUALITY = 60
+
+
+def ensure_artifact_dirs():
+    # Папки создаются при запуске команды, а не при импорте.
+    ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+    SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
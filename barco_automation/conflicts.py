@@ -0,0 +1,122 @@
+# Проверка расписания до запуска: пересечения показов в одном дне, перерывы короче уборки
+# и наложения на показы, которые уже стоят на таймлайне. Длительность — из столбца Excel
+# или из каталога фильмов сервера.
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+from .config import CLEANING_MINUTES
+from .plan import show_minutes
+
+
+def show_duration(show, catalogue=None):
+    if show.get("duration"):
+        return int(show["duration"])
+    if catalogue is None:
+        return None
+    match = show.get("match")
+    return catalogue.duration(match["title"] if match else show["title"])
+
+
+def _clock(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class DayIntervals:
+    # Показы одного дня как отрезки [start, end) в минутах, по возрастанию начала.
+    # Пересечения ищутся bisect по началам: кандидаты начинаются не раньше start - самый длинный показ.
+    def __init__(self, intervals):
+        self.items = sorted(intervals, key=lambda item: item[0])
+        self.starts = [item[0] for item in self.items]
+        self.max_length = max((end - start for start, end, _ in self.items), default=0)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def overlapping(self, start, end):
+        lo = bisect_right(self.starts, start - self.max_length)
+        hi = bisect_left(self.starts, end)
+        return [item for item in self.items[lo:hi] if item[1] > start]
+
+
+def build_day_index(entries, catalogue=None):
+    # date -> DayIntervals; показы без известной длительности возвращаются отдельно.
+    by_date = defaultdict(list)
+    unknown = []
+    for entry in entries:
+        duration = show_duration(entry, catalogue)
+        if not duration:
+            unknown.append(entry)
+            continue
+        start = show_minutes(entry)
+        by_date[entry["date"]].append((start, start + duration, entry))
+    return {date: DayIntervals(items) for date, items in by_date.items()}, unknown
+
+
+def schedule_conflicts(entries, catalogue=None, cleaning_min=CLEANING_MINUTES):
+    # Один проход по каждому отсортированному дню: сравниваем с показом, который кончается позже всех.
+    index, unknown = build_day_index(entries, catalogue)
+    conflicts = []
+    for date, day in sorted(index.items(), key=lambda item: item[0].split(".")[::-1]):
+        last = None
+        for start, end, entry in day:
+            if last is not None:
+                if start < last[1]:
+                    conflicts.append(
+                        {"kind": "overlap", "date": date, "show": entry, "other": last[2], "minutes": last[1] - start}
+                    )
+                elif start - last[1] < cleaning_min:
+                    conflicts.append(
+                        {"kind": "gap", "date": date, "show": entry, "other": last[2], "minutes": start - last[1]}
+                    )
+            if last is None or end > last[1]:
+                last = (start, end, entry)
+    return conflicts, unknown
+
+
+def timeline_collisions(shows, blocks, catalogue=None):
+    # shows — что будет поставлено в день; blocks — показы таймлайна, которых нет в Excel.
+    existing = []
+    for block in blocks:
+        duration = block.get("duration") or (catalogue.duration(block["title"]) if catalogue is not None else None)
+        if block["minutes"] is not None and duration:
+            existing.append((block["minutes"], block["minutes"] + int(duration), block))
+    if not existing:
+        return []
+    day = DayIntervals(existing)
+    collisions = []
+    for show in shows:
+        duration = show_duration(show, catalogue)
+        if not duration:
+            continue
+        start = show_minutes(show)
+        for block_start, block_end, block in day.overlapping(start, start + duration):
+            collisions.append(
+                {
+                    "kind": "collision",
+                    "date": show["date"],
+                    "show": show,
+                    "other": {"title": block["title"], "time": _clock(block_start)},
+                    "minutes": min(block_end, start + duration) - max(block_start, start),
+                }
+            )
+    return collisions
+
+
+CONFLICT_LABELS = {
+    "overlap": ("❌", "пересекается с"),
+    "collision": ("❌", "накладывается на показ таймлайна"),
+    "gap": ("⚠️", "перерыв меньше уборки после"),
+}
+
+
+def print_conflicts(name, conflicts, unknown=()):
+    for c in conflicts:
+        show, other = c["show"], c["other"]
+        icon, text = CONFLICT_LABELS[c["kind"]]
+        print(
+            f"{icon} [{name}] {c['date']} {show['time']} {show['title']}: "
+            f"{text} {other['time']} {other['title']} ({c['minutes']} мин.)"
+        )
+    if unknown:
+        print(f"⚠️ [{name}] Длительность неизвестна, не проверено на пересечения: {len(unknown)} показов")
@@ -0,0 +1,81 @@
+# Колонки дней видимой недели и перелистывание nextHeader/prevHeader.
+
+from datetime import datetime
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .config import MAX_WEEK_PAGES
+from .dom import dom_query
+from .waits import wait_step
+
+
+def read_header_dates(driver):
+    # Все даты dayHeader одним вызовом, в порядке колонок.
+    return [row["text"].replace("/", ".") for row in dom_query(driver, "scan", None, ".dayHeader", ".date")]
+
+
+def header_dates_changed(before):
+    # Условие для wait_step: неделя перерисовалась после nextHeader/prevHeader.
+    def _condition(driver):
+        dates = read_header_dates(driver)
+        return dates if dates and dates != before else False
+
+    return _condition
+
+
+class DayColumns:
+    # Карта дата -> индекс колонки dayHeader/dayView для видимой недели.
+    # Читается одним вызовом и перечитывается только после перелистывания.
+    def __init__(self, driver):
+        self.driver = driver
+        self.page = 0
+        self.columns = {}
+        self.origin = None
+        self.refresh()
+        if self.origin is None:
+            WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.CLASS_NAME, "dayHeader")))
+            self.refresh()
+
+    def refresh(self, dates=None):
+        dates = dates if dates is not None else read_header_dates(self.driver)
+        self.columns = {date: i for i, date in enumerate(dates)}
+        if self.page == 0:
+            self.origin = self._contiguous_start(dates)
+        return self.columns
+
+    @staticmethod
+    def _contiguous_start(dates):
+        # Первая дата недели, если колонки — подряд идущие дни; иначе листать вслепую нельзя.
+        try:
+            days = [datetime.strptime(d, "%d.%m.%Y") for d in dates]
+        except ValueError:
+            return None
+        if not days or any((b - a).days != 1 for a, b in zip(days, days[1:])):
+            return None
+        return days[0]
+
+    def locate(self, date):
+        # (страница, колонка) относительно открытой недели; None, если дату не достать.
+        if self.page == 0 and date in self.columns:
+            return 0, self.columns[date]
+        if self.origin is None:
+            return None
+        delta = (datetime.strptime(date, "%d.%m.%Y") - self.origin).days
+        page, column = divmod(delta, len(self.columns))
+        if abs(page) > MAX_WEEK_PAGES:
+            return None
+        return page, column
+
+    def goto(self, page, date):
+        # Листаем неделю до нужной страницы и возвращаем фактический индекс колонки даты.
+        while self.page != page:
+            step = 1 if page > self.page else -1
+            before = list(self.columns)
+            dom_query(self.driver, "click", None, ".nextHeader" if step > 0 else ".prevHeader", 0)
+            dates = wait_step(self.driver, "week", header_dates_changed(before))
+            self.page += step
+            self.refresh(dates)
+            print(f"📆 Неделя {dates[0]} – {dates[-1]}")
+        return self.columns.get(date)
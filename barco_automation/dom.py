@@ -0,0 +1,105 @@
+# JS-запросы к DOM одним вызовом execute_script.
+
+# Мини-библиотека запросов к DOM: ставится в страницу один раз и отдаёт
+# тексты/классы всех элементов контейнера за один вызов execute_script.
+DOM_QUERY_JS = """
+window.__barcoQuery = {
+  root: function (root) {
+    if (typeof root === 'string') return document.querySelector(root);
+    return root || document;
+  },
+  visible: function (el) {
+    const style = window.getComputedStyle(el);
+    return style.display !== 'none' && style.visibility !== 'hidden' && el.getClientRects().length > 0;
+  },
+  scan: function (root, selector, sub, withElements) {
+    const r = this.root(root);
+    if (!r) return [];
+    return Array.from(r.querySelectorAll(selector)).map((el, i) => {
+      const node = sub ? (el.querySelector(sub) || el) : el;
+      const row = {
+        index: i,
+        text: (node.innerText || node.textContent || '').trim(),
+        cls: el.getAttribute('class') || '',
+        visible: this.visible(el),
+        duration: el.getAttribute('data-duration'),
+      };
+      if (withElements) row.el = el;
+      return row;
+    });
+  },
+  click: function (root, selector, index) {
+    const r = this.root(root);
+    const el = r ? r.querySelectorAll(selector)[index] : null;
+    if (!el) return false;
+    el.scrollIntoView({block: 'center'});
+    el.click();
+    return true;
+  },
+  clickText: function (root, selector, text, skipClass) {
+    const r = this.root(root);
+    const nodes = r ? Array.from(r.querySelectorAll(selector)).filter((el) => this.visible(el)) : [];
+    for (const el of nodes) {
+      if ((el.innerText || el.textContent || '').trim() !== text) continue;
+      if (skipClass && el.classList.contains(skipClass)) continue;
+      el.click();
+      return {ready: true, found: true};
+    }
+    return {ready: nodes.length > 0, found: false};
+  },
+  clickEntry: function (root, selector, index, text, count) {
+    // Клик по заранее найденной строке списка, только если список не поменялся.
+    const r = this.root(root);
+    const nodes = r ? r.querySelectorAll(selector) : [];
+    if (!Array.from(nodes).some((el) => this.visible(el))) return {ready: false};
+    const el = nodes[index];
+    const actual = el ? (el.innerText || el.textContent || '').trim() : null;
+    if (nodes.length !== count || actual !== text) return {ready: true, clicked: false, count: nodes.length};
+    el.scrollIntoView({block: 'center'});
+    el.click();
+    return {ready: true, clicked: true};
+  },
+};
+"""
+
+
+_DOM_QUERY_CALL_JS = """
+const q = window.__barcoQuery;
+if (!q) return {__missing: true};
+return q[arguments[0]].apply(q, Array.prototype.slice.call(arguments, 1));
+"""
+
+
+def dom_query(driver, method, *args):
+    result = driver.execute_script(_DOM_QUERY_CALL_JS, method, *args)
+    if isinstance(result, dict) and result.get("__missing"):
+        # Библиотека пропадает после перезагрузки страницы — ставим заново.
+        driver.execute_script(DOM_QUERY_JS)
+        result = driver.execute_script(_DOM_QUERY_CALL_JS, method, *args)
+    return result
+
+
+def dom_click_text_when_ready(root, selector, text, skip_class=None):
+    # Условие для wait_step: ждём, пока ячейки пикера станут видимы, и кликаем нужную.
+    def _condition(driver):
+        result = dom_query(driver, "clickText", root, selector, text, skip_class)
+        return result if result.get("ready") else False
+
+    return _condition
+
+
+def list_of_shows_populated(driver):
+    rows = dom_query(driver, "scan", "#listOfShows", "a")
+    if rows and any(row["visible"] for row in rows):
+        return rows
+    return False
+
+
+def catalogue_entry_clicked(index, title, count):
+    # Условие для wait_step: ждём раскрытия listOfShows и кликаем строку index,
+    # если длина списка и текст строки совпадают с каталогом.
+    def _condition(driver):
+        result = dom_query(driver, "clickEntry", "#listOfShows", "a", index, title, count)
+        return result if result.get("ready") else False
+
+    return _condition
@@ -0,0 +1,270 @@
+# Чтение расписания из Excel: поиск файла, разбор листа и кеш разбора.
+
+from datetime import datetime
+import hashlib
+import json
+import os
+import re
+
+from .config import (
+    BASE_DIR,
+    HALLS_PATH,
+    SCHEDULE_CACHE_PATH,
+    SCHEDULE_DURATION_COLUMN,
+    SCHEDULE_PARSER_VERSION,
+    TITLE_SUFFIX_PATTERN,
+)
+from .tracing import trace_span
+
+
+def find_excel_files():
+    # Все книги с расписанием в папке проекта: по книге на зал или одна книга с листами залов.
+    preferred_patterns = [
+        "Рассписание*.xlsx",
+        "Рассписание*.xlsm",
+        "Рассписание*.xls",
+        "Расписание*.xlsx",
+        "Расписание*.xlsm",
+        "Расписание*.xls",
+    ]
+    found = []
+    for pattern in preferred_patterns:
+        for path in sorted(BASE_DIR.glob(pattern)):
+            if path not in found:
+                found.append(path)
+    if found:
+        return found
+    raise FileNotFoundError(
+        f"Excel файл с именем 'Рассписание' не найден в папке проекта: {BASE_DIR}"
+    )
+
+
+def parse_schedule_frame(df, duration_column=False):
+    # pandas грузится только здесь: parse/validate по кешу и --schedule-json обходятся без него.
+    # duration_column: третий столбец df — длительность фильма в минутах.
+    import pandas as pd
+
+    if df.empty or df.shape[1] < 2:
+        return []
+    first = df.iloc[:, 0]
+    second = df.iloc[:, 1]
+
+    is_text = first.map(lambda v: isinstance(v, str))
+    is_stamp = first.map(lambda v: isinstance(v, datetime))
+    if not is_text.any():
+        return []
+    text = first.where(is_text).str.strip()
+
+    # Строка-дата задаёт текущую дату для всех следующих строк со временем.
+    dates = pd.to_datetime(text, format="%d.%m.%Y", errors="coerce")
+    dates = dates.fillna(pd.to_datetime(first.where(is_stamp), errors="coerce"))
+    current_date = dates.dt.strftime("%d.%m.%Y").ffill()
+
+    is_show = text.str.contains(":", regex=False, na=False) & second.notna() & current_date.notna()
+    titles = (
+        second[is_show]
+        .astype(str)
+        .str.strip()
+        .str.split(TITLE_SUFFIX_PATTERN, n=1, regex=True)
+        .str[0]
+    )
+    shows = pd.DataFrame({"date": current_date[is_show], "time": text[is_show], "title": titles})
+    records = shows.to_dict("records")
+    if duration_column and df.shape[1] > 2:
+        durations = pd.to_numeric(df.iloc[:, 2][is_show], errors="coerce")
+        for record, duration in zip(records, durations):
+            if duration > 0:
+                record["duration"] = int(duration)
+    return records
+
+
+def _file_sha1(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_schedule_cache():
+    try:
+        with open(SCHEDULE_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _write_schedule_cache(cache):
+    tmp_path = SCHEDULE_CACHE_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp_path, SCHEDULE_CACHE_PATH)
+
+
+def parse_sheet(excel_path, sheet_name, duration_column=SCHEDULE_DURATION_COLUMN):
+    # Один лист книги; запускается и в дочернем процессе пула, поэтому всё передаётся аргументами.
+    import pandas as pd
+
+    # Столбцы по номеру, а не диапазоном "A:B": узкий лист (заметки) не ошибка, а лист без показов.
+    wanted = [0, 1] + ([_column_index(duration_column)] if duration_column else [])
+    df = pd.read_excel(excel_path, sheet_name=sheet_name, header=None, usecols=lambda column: column in wanted)
+    if df.shape[1] < 2:
+        return []
+    # Нет столбца длительности на листе — длительность неизвестна, показы остаются.
+    return parse_schedule_frame(df, duration_column=df.shape[1] > 2)
+
+
+def _column_index(letters):
+    # "A" -> 0, "C" -> 2, "AA" -> 26.
+    index = 0
+    for letter in letters.strip().upper():
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def list_sheets(excel_path):
+    import pandas as pd
+
+    with pd.ExcelFile(excel_path) as book:
+        return list(book.sheet_names)
+
+
+def _parse_sheets(tasks):
+    # Листы разбираются параллельно в процессах: общее время — примерно как у самого долгого листа.
+    # Ошибка листа не роняет остальные: возвращается вместо его показов.
+    if len(tasks) <= 1:
+        results = []
+        for path, sheet in tasks:
+            try:
+                results.append(parse_sheet(path, sheet))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(parse_sheet, path, sheet, SCHEDULE_DURATION_COLUMN) for path, sheet in tasks]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+def load_workbooks(excel_paths, use_cache=True):
+    # {путь: {лист: показы}}. Кеш разбора на книгу: по mtime/размеру (быстро), затем по sha1 содержимого.
+    parser_key = {"version": SCHEDULE_PARSER_VERSION, "duration_column": SCHEDULE_DURATION_COLUMN}
+    cache = _read_schedule_cache() if use_cache else {}
+    workbooks = {}
+    file_keys = {}
+    tasks = []
+    for excel_path in excel_paths:
+        stat = excel_path.stat()
+        file_key = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, **parser_key}
+        entry = cache.get(str(excel_path)) or {}
+        sha1 = None
+        if entry.get("file") != file_key:
+            sha1 = _file_sha1(excel_path)
+        cached_parser = {name: entry.get("file", {}).get(name) for name in parser_key}
+        file_keys[excel_path] = (file_key, sha1 or entry.get("sha1"))
+
+        if entry.get("file") == file_key or (entry.get("sha1") == sha1 and cached_parser == parser_key):
+            workbooks[excel_path] = entry["sheets"]
+            count = sum(len(shows) for shows in entry["sheets"].values())
+            print(f"♻️ {excel_path.name}: расписание взято из кеша: {count} фильмов")
+        else:
+            workbooks[excel_path] = {}
+            tasks.extend((excel_path, sheet) for sheet in list_sheets(excel_path))
+
+    failed = set()
+    errors = []
+    for (excel_path, sheet), result in zip(tasks, _parse_sheets(tasks)):
+        if isinstance(result, Exception):
+            print(f"⚠️ {excel_path.name} / {sheet}: лист не разобран: {result}")
+            failed.add(excel_path)
+            errors.append(result)
+        else:
+            workbooks[excel_path][sheet] = result
+    if errors and not any(workbooks.values()):
+        raise errors[0]
+
+    for excel_path, (file_key, sha1) in file_keys.items():
+        if excel_path not in failed:
+            cache[str(excel_path)] = {"file": file_key, "sha1": sha1, "sheets": workbooks[excel_path]}
+    try:
+        _write_schedule_cache(cache)
+    except Exception as e:
+        print(f"⚠️ Не удалось сохранить кеш расписания: {e}")
+    return workbooks
+
+
+def load_hall_map(path=HALLS_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def sheet_hall(excel_path, sheet, multi_sheet, hall_map):
+    # Явное соответствие из halls.json: "книга.xlsx/лист", "лист" или "книга.xlsx".
+    for key in (f"{excel_path.name}/{sheet}", sheet, excel_path.name, excel_path.stem):
+        if key in hall_map:
+            return hall_map[key]
+    # Иначе в книге с несколькими листами зал — имя листа, в книге на один зал — имя файла.
+    if multi_sheet:
+        return sheet
+    return re.sub(r"^Расс?писание[\s_-]*", "", excel_path.stem).strip() or excel_path.stem
+
+
+def merge_schedule(workbooks, hall_map=None):
+    # Один список показов с полем hall; ключ показа — зал, дата, время.
+    # Одна книга с одним листом без halls.json — как раньше, без залов.
+    hall_map = hall_map or {}
+    sheets = [
+        (excel_path, sheet, shows, len(by_sheet) > 1)
+        for excel_path, by_sheet in workbooks.items()
+        for sheet, shows in by_sheet.items()
+        if shows
+    ]
+    if len(sheets) == 1 and not hall_map:
+        return list(sheets[0][2])
+
+    merged = {}
+    for excel_path, sheet, shows, multi_sheet in sheets:
+        hall = sheet_hall(excel_path, sheet, multi_sheet, hall_map)
+        print(f"🏛️ {excel_path.name} / {sheet} -> {hall}: {len(shows)} фильмов")
+        for show in shows:
+            key = (hall, show["date"], show["time"])
+            if key in merged:
+                print(
+                    f"⚠️ {hall} {show['date']} {show['time']}: уже есть '{merged[key]['title']}', "
+                    f"'{show['title']}' из {excel_path.name} / {sheet} пропущен"
+                )
+                continue
+            merged[key] = dict(show, hall=hall)
+    return list(merged.values())
+
+
+def read_schedule(excel_paths=None, json_path=None, export_path=None, use_cache=True):
+    # Расписание из готового JSON или из книг Excel (все листы); разобранное по желанию сохраняется в export_path.
+    if json_path is not None:
+        with open(json_path, "r", encoding="utf-8") as f:
+            schedule = json.load(f)
+        print(f"Расписание из {json_path}: {len(schedule)} фильмов")
+        return schedule
+
+    with trace_span("parse"):
+        workbooks = load_workbooks(list(excel_paths), use_cache=use_cache)
+        schedule = merge_schedule(workbooks, load_hall_map())
+    if export_path is not None:
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = export_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(schedule, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, export_path)
+        print(f"✅ Готово! Сохранено {len(schedule)} фильмов в файл {export_path}")
+    return schedule
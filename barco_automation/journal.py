@@ -0,0 +1,60 @@
+# Журнал состояний показов для --resume.
+
+from datetime import datetime
+import json
+import os
+import threading
+
+
+class RunJournal:
+    # Журнал переходов состояний показов: только дописываем, каждую запись fsync.
+    STATES = ("submitted", "created", "moved", "confirmed", "failed")
+    # Один файл на все серверы: пишем под общей блокировкой.
+    _lock = threading.Lock()
+
+    def __init__(self, path, run_id, target=None):
+        self.path = path
+        self.run_id = run_id
+        self.target = target
+        # Последнее состояние показов этого запуска: повтор показа смотрит, что уже сделано.
+        self.last_state = {}
+        self._file = path.open("a", encoding="utf-8")
+
+    def show_key(self, show):
+        return f"{show['date']} {show['time']} {show['title']}"
+
+    def record(self, show, state, **extra):
+        record = {
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "run_id": self.run_id,
+            "target": self.target,
+            "key": self.show_key(show),
+            "state": state,
+        }
+        record.update(extra)
+        self.last_state[record["key"]] = state
+        with self._lock:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def load_states(self):
+        # Последнее состояние каждого показа по всем прошлым запускам.
+        states = {}
+        if not self.path.exists():
+            return states
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Оборванная последняя строка после падения.
+                    continue
+                if record.get("target") != self.target:
+                    continue
+                states[record["key"]] = record["state"]
+        return states
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
@@ -0,0 +1,146 @@
+# Журнал запуска: вывод уходит в очередь, а консоль и файл пишет фоновый поток.
+# В файле — JSON-строки с run_id/target/show/phase, файл ротируется по размеру.
+
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import atexit
+import contextvars
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import traceback
+
+from .config import LOG_PATH
+
+
+LOG_LEVEL = os.getenv("BARCO_LOG_LEVEL", "INFO").upper()
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+CONTEXT_FIELDS = ("run_id", "target", "show", "phase")
+
+log = logging.getLogger("barco_automation")
+
+# run_id общий на весь запуск; target/show/phase — свои у каждого потока.
+_run_fields = {}
+_context = contextvars.ContextVar("barco_log_context", default={})
+_listener = None
+
+
+@contextmanager
+def log_context(**fields):
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+class _ContextQueueHandler(QueueHandler):
+    # Контекст и traceback снимаются в потоке, который пишет, до постановки в очередь.
+    def prepare(self, record):
+        fields = {**_run_fields, **_context.get()}
+        for name in CONTEXT_FIELDS:
+            setattr(record, name, fields.get(name))
+        record.msg = record.getMessage()
+        record.args = None
+        record.traceback = "".join(traceback.format_exception(*record.exc_info)) if record.exc_info else None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+
+class JsonLineFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "thread": record.threadName,
+        }
+        for name in CONTEXT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        entry["msg"] = record.msg
+        if getattr(record, "traceback", None):
+            entry["traceback"] = record.traceback
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class ConsoleFormatter(logging.Formatter):
+    def format(self, record):
+        tb = getattr(record, "traceback", None)
+        return f"{record.msg}\n{tb.rstrip()}" if tb else record.msg
+
+
+class LogStream:
+    # Замена sys.stdout/sys.stderr: каждая строка print становится записью журнала.
+    def __init__(self, level):
+        self.level = level
+        self._local = threading.local()
+
+    def write(self, data):
+        buffer = getattr(self._local, "buffer", "") + data
+        *lines, self._local.buffer = buffer.split("\n")
+        for line in lines:
+            log.log(self.level, line)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def setup_run_log(run_id=None, level=LOG_LEVEL, path=LOG_PATH):
+    # Вызывается командой run. Повторный вызов ничего не делает.
+    global _listener
+    if _listener is not None:
+        return
+    level = logging.getLevelName(level) if isinstance(level, str) else level
+    _run_fields["run_id"] = run_id
+
+    console = logging.StreamHandler(sys.__stdout__)
+    console.setFormatter(ConsoleFormatter())
+    file_handler = RotatingFileHandler(
+        path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8", delay=True
+    )
+    file_handler.setFormatter(JsonLineFormatter())
+
+    records = queue.SimpleQueue()
+    _listener = QueueListener(records, console, file_handler)
+    log.addHandler(_ContextQueueHandler(records))
+    log.setLevel(level)
+    log.propagate = False
+    _listener.start()
+
+    sys.stdout = LogStream(logging.INFO)
+    sys.stderr = LogStream(logging.WARNING)
+    sys.excepthook = _global_excepthook
+    atexit.register(shutdown_run_log)
+    log.info(f"\n===== Start run: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} =====")
+
+
+def shutdown_run_log():
+    # Возвращаем стандартные потоки и дописываем очередь до конца.
+    global _listener
+    if _listener is None:
+        return
+    sys.stdout = sys.__stdout__
+    sys.stderr = sys.__stderr__
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def log_exception(context):
+    log.error(f"❗ {context}:", exc_info=True)
+
+
+def _global_excepthook(exc_type, exc_value, exc_tb):
+    log.critical("❗ Необработанная ошибка:", exc_info=(exc_type, exc_value, exc_tb))
@@ -0,0 +1,574 @@
+# Локальная заглушка планировщика Barco SMS для проверки автоматизации без проектора.
+# Страница повторяет нужную скрипту разметку: страница сертификата, логин,
+# dayHeader/dayView/hourLine/rowItem, поповер с listOfShows, menuShow/moveTo,
+# datepicker/timepicker и confirmDateTimeBtn.
+#
+#   python -m barco_automation.mock_server --port 8765 --latency-ms 50
+#   python -m barco_automation run --target "Зал 1=http://127.0.0.1:8765"
+#
+# API заглушки (пути, тела запросов и поля ответов) придуман для неё самой, это не снятый
+# контракт Barco SMS. run --backend api работает только с заглушкой:
+#   python -m barco_automation run --backend api --target "Зал 1=http://127.0.0.1:8765"
+
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from datetime import datetime, timedelta
+import argparse
+import json
+import secrets
+import threading
+import time
+
+
+DEFAULT_FILMS = [
+    {"title": "Ушакова", "duration": 120},
+    {"title": "Мульт в кино", "duration": 75},
+    {"title": "Дюна: Часть вторая", "duration": 166},
+    {"title": "Холоп 2", "duration": 110},
+    {"title": "Мастер и Маргарита", "duration": 157},
+]
+MOCK_USERNAME = "admin"
+MOCK_PASSWORD = "Admin1234"
+SESSION_COOKIE = "sms_session"
+# Заголовок каждого ответа заглушки: по нему SmsApiClient отличает её от настоящего сервера.
+MOCK_HEADER = "X-Barco-Sms-Mock"
+# Пути API заглушки, по которым ходит SmsApiClient.
+MOCK_API_ENDPOINTS = {
+    "login": "/api/login",
+    "session": "/api/session",
+    "catalogue": "/api/catalogue",
+    "shows": "/api/shows",
+    "show": "/api/shows/{id}",
+}
+
+
+class MockSmsState:
+    def __init__(self, films, week_start, latency_ms=0):
+        self.films = films
+        self.week_start = week_start
+        self.latency_ms = latency_ms
+        self.sessions = set()
+        self.shows = {}
+        self.next_id = 1
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def film_duration(self, title):
+        for film in self.films:
+            if film["title"] == title:
+                return film["duration"]
+        return 90
+
+    def add_show(self, date, start, title):
+        with self.lock:
+            show = {
+                "id": self.next_id,
+                "date": date,
+                "start": start,
+                "title": title,
+                "duration": self.film_duration(title),
+            }
+            self.shows[show["id"]] = show
+            self.next_id += 1
+            return dict(show)
+
+    def move_show(self, show_id, date, start):
+        with self.lock:
+            show = self.shows.get(show_id)
+            if show is None:
+                return None
+            show["date"] = date
+            show["start"] = start
+            return dict(show)
+
+    def list_shows(self):
+        with self.lock:
+            return [dict(s) for s in sorted(self.shows.values(), key=lambda s: (s["date"], s["start"]))]
+
+    def reset(self):
+        with self.lock:
+            self.shows.clear()
+            self.next_id = 1
+
+
+class MockSmsHandler(BaseHTTPRequestHandler):
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def end_headers(self):
+        self.send_header(MOCK_HEADER, "1")
+        super().end_headers()
+
+    def _send_json(self, payload, status=200, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode("utf-8"))
+
+    def _authenticated(self):
+        cookies = self.headers.get("Cookie") or ""
+        for part in cookies.split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == SESSION_COOKIE and value in self.state.sessions:
+                return True
+        return False
+
+    def _api_delay(self):
+        # Имитация задержки ответа сервера Barco.
+        self.state.requests += 1
+        if self.state.latency_ms:
+            time.sleep(self.state.latency_ms / 1000)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path in ("/", "/index.html"):
+            body = render_app_html(self.state).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if not url.path.startswith("/api/"):
+            self._send_json({"error": "not found"}, status=404)
+            return
+        self._api_delay()
+        if url.path == "/api/session":
+            self._send_json({"authenticated": self._authenticated()})
+            return
+        if not self._authenticated():
+            self._send_json({"error": "unauthorized"}, status=401)
+            return
+        if url.path == "/api/catalogue":
+            self._send_json(self.state.films)
+        elif url.path == "/api/shows":
+            shows = self.state.list_shows()
+            date = parse_qs(url.query).get("date")
+            if date:
+                shows = [s for s in shows if s["date"] in date]
+            self._send_json(shows)
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        self._api_delay()
+        if url.path == "/api/login":
+            payload = self._read_json()
+            if payload.get("username") != MOCK_USERNAME or payload.get("password") != MOCK_PASSWORD:
+                self._send_json({"error": "bad credentials"}, status=401)
+                return
+            token = secrets.token_hex(16)
+            self.state.sessions.add(token)
+            self._send_json({"ok": True}, headers={"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/"})
+            return
+        if not self._authenticated():
+            self._send_json({"error": "unauthorized"}, status=401)
+            return
+        if url.path == "/api/shows":
+            payload = self._read_json()
+            if not all(payload.get(k) for k in ("date", "start", "title")):
+                self._send_json({"error": "date, start and title are required"}, status=400)
+                return
+            self._send_json(self.state.add_show(payload["date"], payload["start"], payload["title"]), status=201)
+        elif url.path == "/api/reset":
+            self.state.reset()
+            self._send_json({"ok": True})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_PUT(self):
+        url = urlparse(self.path)
+        self._api_delay()
+        if not self._authenticated():
+            self._send_json({"error": "unauthorized"}, status=401)
+            return
+        parts = url.path.strip("/").split("/")
+        if len(parts) != 3 or parts[:2] != ["api", "shows"] or not parts[2].isdigit():
+            self._send_json({"error": "not found"}, status=404)
+            return
+        payload = self._read_json()
+        show = self.state.move_show(int(parts[2]), payload.get("date"), payload.get("start"))
+        if show is None:
+            self._send_json({"error": "show not found"}, status=404)
+            return
+        self._send_json(show)
+
+
+def synthetic_films(count, duration=5):
+    # Каталог для нагрузочных прогонов: короткие фильмы, чтобы много показов влезло в день.
+    return [{"title": f"Фильм {i:03d}", "duration": duration} for i in range(1, count + 1)]
+
+
+def monday_of(day):
+    return day - timedelta(days=day.weekday())
+
+
+def start_mock_server(port=0, latency_ms=0, films=None, week_start=None, host="127.0.0.1"):
+    state = MockSmsState(
+        films or DEFAULT_FILMS,
+        week_start or monday_of(datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0),
+        latency_ms,
+    )
+    handler = type("BoundMockSmsHandler", (MockSmsHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.state = state
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://{host}:{server.server_address[1]}"
+    return server, url
+
+
+def render_app_html(state):
+    config = {"weekStart": state.week_start.strftime("%Y-%m-%d")}
+    return APP_HTML.replace("__CONFIG__", json.dumps(config))
+
+
+APP_HTML = """<!DOCTYPE html>
+<html lang="ru">
+<head>
+<meta charset="UTF-8">
+<title>Barco SMS (mock)</title>
+<style>
+  body { font-family: sans-serif; margin: 0; }
+  .hidden { display: none !important; }
+  #headers { display: flex; position: sticky; top: 0; background: #eee; z-index: 5; }
+  .dayHeader, .dayView { width: 180px; flex: 0 0 180px; }
+  .dayHeader { padding: 4px; cursor: pointer; }
+  .dayHeader.active { background: #cde; }
+  .nextHeader, .prevHeader { width: 30px; cursor: pointer; text-align: center; }
+  .timLineViewArea { height: 700px; overflow-y: auto; position: relative; }
+  #schedulerTimeViewInner { display: flex; padding-left: 30px; }
+  .dayView { position: relative; height: 1920px; border-left: 1px solid #ccc; }
+  .hourLine { position: absolute; left: 0; right: 0; height: 80px; border-top: 1px solid #ddd; font-size: 10px; color: #999; }
+  .rowItem { position: absolute; left: 4px; right: 30%; background: #8bc; border: 1px solid #468; overflow: hidden; z-index: 2; font-size: 11px; cursor: pointer; }
+  .showPlaceHolder { position: absolute; left: 4px; right: 30%; height: 20px; background: #fc6; z-index: 2; }
+  #showPlaceHolderPopover, #showMenu { position: fixed; background: #fff; border: 1px solid #333; padding: 6px; z-index: 10; }
+  #listOfShows { max-height: 200px; overflow-y: auto; margin: 4px 0; padding-left: 16px; }
+  .modal { position: fixed; left: 30%; top: 10%; background: #fff; border: 2px solid #333; padding: 10px; z-index: 20; }
+  .modal-backdrop { position: fixed; inset: 0; background: rgba(0,0,0,.2); z-index: 15; }
+  .day, .hour, .minute { padding: 2px 5px; cursor: pointer; }
+  .day.old, .day.new { color: #bbb; }
+  .day.active { background: #468; color: #fff; }
+  .lockAppRed { color: red; }
+</style>
+</head>
+<body>
+<div id="interstitial" class="hidden">
+  <h2>Подключение не защищено</h2>
+  <button id="details-button">Дополнительные</button>
+  <div id="details" class="hidden"><a id="proceed-link" href="#">Перейти на сайт (небезопасно)</a></div>
+</div>
+<div id="login" class="hidden">
+  <input id="loginUsername" placeholder="login">
+  <input id="loginPass" type="password" placeholder="password">
+  <button id="loginSubmit">Войти</button>
+</div>
+<div id="home" class="hidden"><a href="#sms/scheduler">Scheduler</a></div>
+<div id="app" class="hidden">
+  <span id="lockApp" class="lockAppRed">&#128274;</span>
+  <div id="headers"></div>
+  <div class="timLineViewArea"><div id="schedulerTimeViewInner"></div></div>
+</div>
+<div id="showPlaceHolderPopover" class="hidden">
+  <div class="popover-inner">
+    <span class="selectedShow">—</span>
+    <button class="caretBtn">&#9660;</button>
+    <ul id="listOfShows" class="hidden"></ul>
+    <button class="ok btn">OK</button>
+  </div>
+</div>
+<div id="showMenu" class="hidden">
+  <a id="menuShow" href="javascript:void(0)">Показ</a>
+  <div id="showSubMenu" class="hidden"><a id="moveTo" href="javascript:void(0)">Переместить</a></div>
+</div>
+<div id="dateTimeModal" class="modal hidden">
+  <button class="close" data-dismiss="modal">&times;</button>
+  <div class="datepicker"><div class="datepicker-days"><table class="table-condensed"><tbody></tbody></table></div></div>
+  <div class="timepicker">
+    <div class="timepicker-picker">
+      <a data-action="incrementMinutes" href="javascript:void(0)">&#9650;</a>
+      <span class="timepicker-hour"></span>:<span class="timepicker-minute"></span>
+      <a data-action="decrementMinutes" href="javascript:void(0)">&#9660;</a>
+    </div>
+    <div class="timepicker-hours hidden"><table><tbody></tbody></table></div>
+    <div class="timepicker-minutes hidden"><table><tbody></tbody></table></div>
+  </div>
+  <button id="confirmDateTimeBtn">Сохранить</button>
+</div>
+<script>
+const CONFIG = __CONFIG__;
+const HOUR_PX = 80;
+const MINUTE_STEP = 3;
+const state = {weekStart: new Date(CONFIG.weekStart + 'T00:00:00'), shows: [], films: [], pending: null, selected: null, picker: null};
+
+const $ = (sel) => document.querySelector(sel);
+const pad = (n) => String(n).padStart(2, '0');
+const dmy = (d) => pad(d.getDate()) + '.' + pad(d.getMonth() + 1) + '.' + d.getFullYear();
+const parseDmy = (s) => { const [d, m, y] = s.split('.').map(Number); return new Date(y, m - 1, d); };
+const show = (el, on) => el.classList.toggle('hidden', !on);
+
+function api(method, path, body) {
+  return fetch(path, {
+    method, credentials: 'same-origin',
+    headers: body ? {'Content-Type': 'application/json'} : {},
+    body: body ? JSON.stringify(body) : undefined,
+  }).then((r) => r.json().then((data) => ({ok: r.ok, data})));
+}
+
+function route() {
+  ['interstitial', 'login', 'home', 'app'].forEach((id) => show(document.getElementById(id), false));
+  if (!sessionStorage.getItem('proceeded')) { show($('#interstitial'), true); return; }
+  api('GET', '/api/session').then(({data}) => {
+    if (!data.authenticated) { show($('#login'), true); return; }
+    if (location.hash.indexOf('#sms/scheduler') === 0) { show($('#app'), true); loadScheduler(); }
+    else { show($('#home'), true); }
+  });
+}
+
+$('#details-button').onclick = () => show($('#details'), true);
+$('#proceed-link').onclick = (e) => { e.preventDefault(); sessionStorage.setItem('proceeded', '1'); route(); };
+$('#loginSubmit').onclick = () => {
+  api('POST', '/api/login', {username: $('#loginUsername').value, password: $('#loginPass').value})
+    .then(({ok}) => { if (ok) route(); else alert('Неверный логин'); });
+};
+$('#lockApp').onclick = () => { $('#lockApp').className = 'lockAppGreen'; };
+window.addEventListener('hashchange', route);
+
+function weekDates() {
+  return Array.from({length: 7}, (_, i) => new Date(state.weekStart.getFullYear(), state.weekStart.getMonth(), state.weekStart.getDate() + i));
+}
+
+function loadScheduler() {
+  Promise.all([api('GET', '/api/catalogue'), api('GET', '/api/shows')]).then(([films, shows]) => {
+    state.films = films.data;
+    state.shows = shows.data;
+    renderList();
+    renderWeek();
+  });
+}
+
+function reloadShows() {
+  return api('GET', '/api/shows').then(({data}) => { state.shows = data; renderShows(); });
+}
+
+function renderList() {
+  $('#listOfShows').innerHTML = state.films.map((f, i) =>
+    '<li><a href="javascript:void(0)" data-index="' + i + '" data-duration="' + f.duration + '">' + f.title + '</a></li>').join('');
+}
+
+function renderWeek() {
+  const dates = weekDates();
+  const headers = $('#headers');
+  headers.innerHTML = '<span class="prevHeader">&lsaquo;</span>' + dates.map((d) =>
+    '<div class="dayHeader"><span class="date">' + pad(d.getDate()) + '/' + pad(d.getMonth() + 1) + '/' + d.getFullYear() + '</span></div>'
+  ).join('') + '<span class="nextHeader">&rsaquo;</span>';
+  headers.querySelector('.prevHeader').onclick = () => shiftWeek(-7);
+  headers.querySelector('.nextHeader').onclick = () => shiftWeek(7);
+  headers.querySelectorAll('.dayHeader').forEach((h) => {
+    h.onclick = () => { headers.querySelectorAll('.dayHeader').forEach((x) => x.classList.remove('active')); h.classList.add('active'); };
+  });
+  const inner = $('#schedulerTimeViewInner');
+  inner.innerHTML = dates.map(() => {
+    let lines = '';
+    for (let h = 0; h < 24; h++) lines += '<div class="hourLine" style="top:' + (h * HOUR_PX) + 'px">' + pad(h) + ':00</div>';
+    return '<div class="dayView">' + lines + '</div>';
+  }).join('');
+  inner.querySelectorAll('.dayView').forEach((view, i) => { view.onclick = (e) => onDayClick(e, view, i); });
+  renderShows();
+}
+
+function shiftWeek(days) {
+  state.weekStart = new Date(state.weekStart.getFullYear(), state.weekStart.getMonth(), state.weekStart.getDate() + days);
+  renderWeek();
+}
+
+function renderShows() {
+  const dates = weekDates().map(dmy);
+  document.querySelectorAll('.dayView').forEach((view, i) => {
+    view.querySelectorAll('.rowItem').forEach((el) => el.remove());
+    state.shows.filter((s) => s.date === dates[i]).forEach((s) => {
+      const [h, m] = s.start.split(':').map(Number);
+      const el = document.createElement('div');
+      el.className = 'rowItem';
+      el.dataset.id = s.id;
+      el.style.top = ((h * 60 + m) / 60 * HOUR_PX) + 'px';
+      el.style.height = Math.max(4, s.duration / 60 * HOUR_PX) + 'px';
+      el.innerHTML = '<div class="time">' + s.start + '</div><div class="title">' + s.title + '</div>';
+      el.onclick = (e) => { e.stopPropagation(); openShowMenu(s, el); };
+      view.appendChild(el);
+    });
+  });
+}
+
+function onDayClick(e, view, index) {
+  if (e.target.closest('.rowItem')) return;
+  const rect = view.getBoundingClientRect();
+  const minutes = Math.max(0, Math.min(24 * 60 - 1, Math.floor((e.clientY - rect.top) / HOUR_PX * 60)));
+  document.querySelectorAll('.showPlaceHolder').forEach((el) => el.remove());
+  const ph = document.createElement('div');
+  ph.className = 'showPlaceHolder';
+  ph.style.top = (minutes / 60 * HOUR_PX) + 'px';
+  view.appendChild(ph);
+  state.pending = {date: dmy(weekDates()[index]), start: pad(Math.floor(minutes / 60)) + ':' + pad(minutes % 60), title: null};
+  $('.selectedShow').textContent = '—';
+  const pop = $('#showPlaceHolderPopover');
+  pop.style.left = Math.min(window.innerWidth - 260, rect.right) + 'px';
+  pop.style.top = Math.max(10, Math.min(window.innerHeight - 300, e.clientY)) + 'px';
+  show($('#listOfShows'), false);
+  show(pop, true);
+}
+
+$('.caretBtn').onclick = (e) => { e.stopPropagation(); show($('#listOfShows'), $('#listOfShows').classList.contains('hidden')); };
+$('#listOfShows').onclick = (e) => {
+  const a = e.target.closest('a');
+  if (!a || !state.pending) return;
+  state.pending.title = a.textContent;
+  $('.selectedShow').textContent = a.textContent;
+  show($('#listOfShows'), false);
+};
+$('#showPlaceHolderPopover .ok').onclick = () => {
+  if (!state.pending || !state.pending.title) return;
+  const pending = state.pending;
+  state.pending = null;
+  api('POST', '/api/shows', pending).then(() => {
+    show($('#showPlaceHolderPopover'), false);
+    document.querySelectorAll('.showPlaceHolder').forEach((el) => el.remove());
+    return reloadShows();
+  });
+};
+
+function openShowMenu(s, el) {
+  state.selected = s;
+  const rect = el.getBoundingClientRect();
+  const menu = $('#showMenu');
+  menu.style.left = rect.right + 'px';
+  menu.style.top = Math.max(10, Math.min(window.innerHeight - 80, rect.top)) + 'px';
+  show($('#showSubMenu'), false);
+  show(menu, true);
+}
+
+$('#menuShow').onclick = () => show($('#showSubMenu'), true);
+$('#moveTo').onclick = () => {
+  show($('#showMenu'), false);
+  const [h, m] = state.selected.start.split(':').map(Number);
+  state.picker = {date: parseDmy(state.selected.date), hour: h, minute: m};
+  renderDatepicker();
+  renderTimepicker();
+  const backdrop = document.createElement('div');
+  backdrop.className = 'modal-backdrop';
+  document.body.appendChild(backdrop);
+  show($('#dateTimeModal'), true);
+};
+
+function renderDatepicker() {
+  const d = state.picker.date;
+  const first = new Date(d.getFullYear(), d.getMonth(), 1);
+  const start = new Date(first.getFullYear(), first.getMonth(), 1 - ((first.getDay() + 6) % 7));
+  let html = '';
+  for (let w = 0; w < 6; w++) {
+    html += '<tr>';
+    for (let i = 0; i < 7; i++) {
+      const cell = new Date(start.getFullYear(), start.getMonth(), start.getDate() + w * 7 + i);
+      let cls = 'day';
+      if (cell.getMonth() < d.getMonth() || cell.getFullYear() < d.getFullYear()) cls += ' old notSelectable';
+      else if (cell.getMonth() > d.getMonth() || cell.getFullYear() > d.getFullYear()) cls += ' new notSelectable';
+      else if (cell.getDate() === d.getDate()) cls += ' active';
+      html += '<td class="' + cls + '" data-date="' + dmy(cell) + '">' + cell.getDate() + '</td>';
+    }
+    html += '</tr>';
+  }
+  $('.datepicker-days tbody').innerHTML = html;
+}
+
+function renderTimepicker() {
+  $('.timepicker-hour').textContent = pad(state.picker.hour);
+  $('.timepicker-minute').textContent = pad(state.picker.minute);
+  let hours = '';
+  for (let h = 0; h < 24; h++) hours += (h % 4 === 0 ? '<tr>' : '') + '<td class="hour">' + pad(h) + '</td>';
+  $('.timepicker-hours tbody').innerHTML = hours;
+  let minutes = '';
+  for (let m = 0; m < 60; m += MINUTE_STEP) minutes += (m % 12 === 0 ? '<tr>' : '') + '<td class="minute">' + pad(m) + '</td>';
+  $('.timepicker-minutes tbody').innerHTML = minutes;
+}
+
+$('.datepicker-days').onclick = (e) => {
+  const cell = e.target.closest('.day');
+  if (!cell || cell.classList.contains('notSelectable')) return;
+  state.picker.date = parseDmy(cell.dataset.date);
+  renderDatepicker();
+};
+$('.timepicker-hour').onclick = () => { show($('.timepicker-picker'), false); show($('.timepicker-hours'), true); };
+$('.timepicker-minute').onclick = () => { show($('.timepicker-picker'), false); show($('.timepicker-minutes'), true); };
+$('.timepicker-hours').onclick = (e) => {
+  const cell = e.target.closest('.hour');
+  if (!cell) return;
+  state.picker.hour = Number(cell.textContent);
+  show($('.timepicker-hours'), false); show($('.timepicker-picker'), true); renderTimepicker();
+};
+$('.timepicker-minutes').onclick = (e) => {
+  const cell = e.target.closest('.minute');
+  if (!cell) return;
+  state.picker.minute = Number(cell.textContent);
+  show($('.timepicker-minutes'), false); show($('.timepicker-picker'), true); renderTimepicker();
+};
+document.querySelector('[data-action="incrementMinutes"]').onclick = () => {
+  state.picker.minute = Math.min(60 - MINUTE_STEP, state.picker.minute + MINUTE_STEP); renderTimepicker();
+};
+document.querySelector('[data-action="decrementMinutes"]').onclick = () => {
+  state.picker.minute = Math.max(0, state.picker.minute - MINUTE_STEP); renderTimepicker();
+};
+
+function closeModal() {
+  show($('#dateTimeModal'), false);
+  document.querySelectorAll('.modal-backdrop').forEach((el) => el.remove());
+}
+
+$('#dateTimeModal .close').onclick = closeModal;
+$('#confirmDateTimeBtn').onclick = () => {
+  const p = state.picker;
+  api('PUT', '/api/shows/' + state.selected.id, {date: dmy(p.date), start: pad(p.hour) + ':' + pad(p.minute)})
+    .then(() => { closeModal(); return reloadShows(); });
+};
+
+route();
+</script>
+</body>
+</html>
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Локальная заглушка планировщика Barco SMS")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=int, default=0, help="задержка ответа API, мс")
+    parser.add_argument("--week-start", help="первый день недели на странице, ДД.ММ.ГГГГ")
+    parser.add_argument("--films", type=int, help="вместо стандартного каталога N синтетических фильмов")
+    args = parser.parse_args(argv)
+
+    week_start = datetime.strptime(args.week_start, "%d.%m.%Y") if args.week_start else None
+    films = synthetic_films(args.films) if args.films else None
+    server, url = start_mock_server(args.port, args.latency_ms, films=films, week_start=week_start, host=args.host)
+    print(f"Mock Barco SMS: {url} (логин {MOCK_USERNAME}/{MOCK_PASSWORD})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
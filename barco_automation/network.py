@@ -0,0 +1,165 @@
+# Ожидание тишины в сети по событиям Network.* из performance-лога Chrome (CDP):
+# шаг идёт дальше, как только сервер ответил на запросы, запущенные действием.
+# Заодно копится время ответа сервера по каждому запросу API.
+
+from collections import defaultdict
+from urllib.parse import urlparse
+import json
+import logging
+import re
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+from .config import NETWORK_QUIET_SEC, NETWORK_START_GRACE_SEC, NETWORK_TRACKED_TYPES, NETWORK_WAIT_ENABLED
+from .tracing import percentile
+from .waits import wait_step
+
+
+log = logging.getLogger(__name__)
+
+
+def enable_performance_log(options):
+    # Без этой capability driver.get_log("performance") пуст.
+    if NETWORK_WAIT_ENABLED:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def request_path(url):
+    # /api/shows/17?date=... -> /api/shows/{id}: одна строка отчёта на эндпоинт.
+    return re.sub(r"/\d+(?=/|$)", "/{id}", urlparse(url).path) or "/"
+
+
+class RequestStats:
+    # Время ответа сервера по эндпоинтам (метод + путь) за весь запуск.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.failed = defaultdict(int)
+
+    def add(self, method, path, seconds=None):
+        with self._lock:
+            if seconds is None:
+                self.failed[(method, path)] += 1
+            else:
+                self.latencies[(method, path)].append(seconds)
+
+    def snapshot(self):
+        with self._lock:
+            keys = set(self.latencies) | set(self.failed)
+            return {
+                f"{method} {path}": {
+                    "count": len(self.latencies[(method, path)]),
+                    "failed": self.failed[(method, path)],
+                    "p50": round(percentile(self.latencies[(method, path)], 50), 3),
+                    "p95": round(percentile(self.latencies[(method, path)], 95), 3),
+                }
+                for method, path in sorted(keys)
+            }
+
+    def print_report(self):
+        rows = self.snapshot()
+        if not rows:
+            return
+        print("\n===== Ответы сервера (сек) =====")
+        print(f"{'запрос':<40}{'N':>6}{'ошибок':>8}{'p50':>9}{'p95':>9}")
+        for name, row in rows.items():
+            print(f"{name:<40}{row['count']:>6}{row['failed']:>8}{row['p50']:>9.3f}{row['p95']:>9.3f}")
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+
+REQUEST_STATS = RequestStats()
+
+
+class NetworkMonitor:
+    # Разбирает performance-лог драйвера: какие запросы ещё в полёте, когда было последнее событие.
+    def __init__(self, driver):
+        self.driver = driver
+        self.pending = {}
+        self.started = 0
+        self.last_event = time.monotonic()
+        self.available = NETWORK_WAIT_ENABLED
+
+    def drain(self):
+        if not self.available:
+            return
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            # Не Chrome или лог не включён — остаются обычные ожидания по DOM.
+            log.debug(f"performance-лог недоступен, ожидание сети выключено: {e}")
+            self.available = False
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            self._on_event(message.get("method"), message.get("params") or {})
+
+    def _on_event(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            if params.get("type") not in NETWORK_TRACKED_TYPES:
+                return
+            request = params.get("request") or {}
+            self.started += 1
+            self.pending[request_id] = (
+                request.get("method"),
+                request_path(request.get("url", "")),
+                params["timestamp"],
+                self.started,
+            )
+        elif method in ("Network.loadingFinished", "Network.loadingFailed") and request_id in self.pending:
+            http_method, path, started, _ = self.pending.pop(request_id)
+            seconds = params["timestamp"] - started if method == "Network.loadingFinished" else None
+            REQUEST_STATS.add(http_method, path, seconds)
+        else:
+            return
+        self.last_event = time.monotonic()
+
+    def mark(self):
+        # Снимок перед действием: что уже было в логе, к действию не относится.
+        self.drain()
+        return {"started": self.started, "at": time.monotonic()}
+
+    def idle(self, mark, quiet_sec=NETWORK_QUIET_SEC):
+        def _condition(driver):
+            self.drain()
+            if not self.available:
+                return True
+            now = time.monotonic()
+            if self.started == mark["started"]:
+                # Действие не пошло в сеть — ждём недолго и отпускаем шаг.
+                return now - mark["at"] >= NETWORK_START_GRACE_SEC
+            # Долгие запросы, начатые до действия (опрос сервера), не ждём.
+            in_flight = any(seq > mark["started"] for _, _, _, seq in self.pending.values())
+            return not in_flight and now - self.last_event >= quiet_sec
+
+        return _condition
+
+
+def network_monitor(driver):
+    monitor = getattr(driver, "_network_monitor", None)
+    if monitor is None:
+        monitor = NetworkMonitor(driver)
+        driver._network_monitor = monitor
+    return monitor
+
+
+def network_mark(driver):
+    return network_monitor(driver).mark()
+
+
+def wait_network_idle(driver, step, mark, timeout_sec=None):
+    # Не дождались — не ошибка: дальше всё равно проверяется DOM, просто без ускорения.
+    monitor = network_monitor(driver)
+    try:
+        wait_step(driver, step, monitor.idle(mark), timeout_sec)
+    except TimeoutException:
+        pending = sorted(f"{method} {path}" for method, path, _, seq in monitor.pending.values() if seq > mark["started"])
+        print(f"⚠️ Шаг '{step}': сеть не затихла, в полёте {pending}")
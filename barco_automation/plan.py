@@ -0,0 +1,166 @@
+# План запуска: разрешение показов и сверка с таймлайном без обращения к UI.
+
+from collections import defaultdict
+from datetime import datetime
+
+from .config import PICKER_MINUTE_STEP, SURE_TITLE_SCORE
+from .titles import normalize_title, titles_match
+
+
+def picker_minute(minute):
+    # Минуты в этом пикере идут с шагом 3, поэтому округляем к ближайшему значению.
+    rounded = int(round(int(minute) / PICKER_MINUTE_STEP) * PICKER_MINUTE_STEP)
+    return min(60 - PICKER_MINUTE_STEP, max(0, rounded))
+
+
+def show_minutes(show):
+    hour, minute = show["time"].split(":")
+    return int(hour) * 60 + int(minute)
+
+
+def show_title_matches(show, title):
+    # Фильм выбран в каталоге — на таймлайне ищем ровно его: «Дюна: Часть первая» и
+    # «Мастер спорта» для titles_match тоже похожи, но это другие фильмы.
+    match = show.get("match")
+    if match and match.get("title"):
+        return normalize_title(match["title"]) == normalize_title(title)
+    return titles_match(show["title"], title)
+
+
+def reconcile_day(shows, existing):
+    # Сопоставляем записи Excel с показами, которые уже стоят на таймлайне.
+    plan = {"ok": [], "move": [], "create": [], "extra": []}
+    free = list(existing)
+    unmatched = []
+
+    # 1. То же название и время в пределах шага пикера — ничего не делаем.
+    for show in shows:
+        target = show_minutes(show)
+        in_place = None
+        for block in free:
+            if block["minutes"] is None or abs(block["minutes"] - target) > PICKER_MINUTE_STEP:
+                continue
+            if show_title_matches(show, block["title"]):
+                in_place = block
+                break
+        if in_place is not None:
+            free.remove(in_place)
+            plan["ok"].append((show, in_place))
+        else:
+            unmatched.append(show)
+
+    # 2. Фильм уже есть, но в другое время — переносим ближайший по времени.
+    for show in unmatched:
+        target = show_minutes(show)
+        candidates = [b for b in free if show_title_matches(show, b["title"])]
+        if candidates:
+            block = min(candidates, key=lambda b: abs((b["minutes"] or 0) - target))
+            free.remove(block)
+            plan["move"].append((show, block))
+        else:
+            plan["create"].append(show)
+
+    # 3. Показы на таймлайне, которых нет в Excel, только показываем в отчёте.
+    plan["extra"] = free
+    return plan
+
+
+def print_day_plan(date, plan):
+    print(
+        f"🔁 {date}: на месте {len(plan['ok'])}, перенести {len(plan['move'])}, "
+        f"создать {len(plan['create'])}, лишних на таймлайне {len(plan['extra'])}"
+    )
+    for show, block in plan["move"]:
+        print(f"   ↪ {show['title']}: {block['minutes']} мин. -> {show['time']}")
+    for block in plan["extra"]:
+        print(f"   ⚠️ Нет в Excel: {block['title']} ({block['minutes']} мин.)")
+
+
+def resolve_show(show, day_columns, catalogue=None):
+    # Показ -> запись плана с колонкой дня, фильмом из каталога, часом и минутой пикера.
+    # Возвращает (запись, None) или (None, (вид ошибки, причина)).
+    # Без day_columns (проверка без браузера) колонка дня остаётся неизвестной.
+    try:
+        date = datetime.strptime(show["date"], "%d.%m.%Y")
+    except (KeyError, TypeError, ValueError):
+        return None, ("format", f"неверная дата '{show.get('date')}'")
+    try:
+        hour_time, minuts_time = show["time"].split(":")
+        hour, minute = int(hour_time), int(minuts_time)
+    except (KeyError, AttributeError, ValueError):
+        return None, ("format", f"неверное время '{show.get('time')}'")
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return None, ("format", f"неверное время '{show['time']}'")
+
+    page, column = None, None
+    if day_columns is not None:
+        location = day_columns.locate(show["date"])
+        if location is None:
+            return None, ("date", f"дата {show['date']} не найдена на странице")
+        page, column = location
+
+    match = None
+    if catalogue is not None and len(catalogue):
+        match = catalogue.match(show["title"])
+        if catalogue.stale and (match["index"] is None or match["score"] < SURE_TITLE_SCORE):
+            # Кеш не сверен с сервером: фильм мог появиться позже — найдём его в списке поповера.
+            match = None
+        elif match["index"] is None:
+            return None, ("title", "нет в каталоге сервера")
+        elif match["score"] < SURE_TITLE_SCORE:
+            # «Мастер и Маргарита» -> «Мастер спорта»: лучше ошибка плана, чем чужой фильм.
+            return None, ("title", f"в каталоге только похожий '{match['title']}' (score={match['score']:.2f})")
+
+    entry = dict(show)
+    entry.update(
+        page=page,
+        column=column,
+        day=str(date.day),
+        hour=hour_time,
+        minute=picker_minute(minute),
+        match=match,
+    )
+    return entry, None
+
+
+class RunPlan:
+    # Расписание, заранее разрешённое до первого действия в UI:
+    # entries — что делать, failures — что сделать нельзя и почему.
+    def __init__(self, target_name):
+        self.target_name = target_name
+        self.entries = []
+        self.failures = []
+
+    @classmethod
+    def build(cls, target_name, schedule, day_columns=None, catalogue=None):
+        plan = cls(target_name)
+        for show in schedule:
+            entry, failure = resolve_show(show, day_columns, catalogue)
+            if entry is not None:
+                plan.entries.append(entry)
+            else:
+                plan.failures.append((show, failure[0], failure[1]))
+        return plan
+
+    def by_date(self):
+        # По порядку недель и колонок, чтобы листать календарь только вперёд.
+        grouped = defaultdict(list)
+        for entry in sorted(self.entries, key=lambda e: (e["page"], e["column"])):
+            grouped[entry["date"]].append(entry)
+        return grouped
+
+    def inexact(self):
+        # Совпадения не один в один или с похожими названиями рядом: их стоит проверить глазами.
+        return [e for e in self.entries if e["match"] and (e["match"]["score"] < 1 or e["match"]["ambiguous"])]
+
+    def print_report(self):
+        name = self.target_name
+        weeks = len({e["page"] for e in self.entries if e["page"] is not None})
+        weeks_note = f" (недель: {weeks})" if weeks else ""
+        print(f"🧭 [{name}] План: к выполнению {len(self.entries)}{weeks_note}, с ошибками {len(self.failures)}")
+        for entry in self.inexact():
+            match = entry["match"]
+            similar = f", похожие: {match['ambiguous']}" if match["ambiguous"] else ""
+            print(f"⚠️ [{name}] '{entry['title']}' → '{match['title']}' (score={match['score']:.2f}){similar}")
+        for show, _, reason in self.failures:
+            print(f"❌ [{name}] {show.get('date')} {show.get('time')} {show.get('title')}: {reason}")
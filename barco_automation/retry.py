@@ -0,0 +1,143 @@
+# Повторы шагов UI по единой политике: экспоненциальная пауза с джиттером,
+# бюджет времени на шаг, общий дедлайн запуска и восстановление UI между попытками.
+
+from collections import defaultdict
+import json
+import logging
+import random
+import threading
+import time
+
+
+log = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    def __init__(self, attempts, base_delay, max_delay, budget_sec, recover=()):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_sec = budget_sec
+        self.recover = tuple(recover)
+
+    def delay(self, attempt):
+        # Пауза перед попыткой attempt + 1: base * 2^(attempt-1), случайно в пределах [50%, 100%].
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+
+# Восстановление — имена действий из RECOVERY_ACTIONS, выполняются перед следующей попыткой.
+RETRY_POLICIES = {
+    "slot_click": RetryPolicy(3, 0.2, 1.0, 5, recover=("clear_backdrop",)),
+    "popover": RetryPolicy(3, 0.3, 1.5, 12, recover=("clear_backdrop", "scroll_top")),
+    "menu_show": RetryPolicy(3, 0.3, 1.5, 10, recover=("clear_backdrop",)),
+    "move_to": RetryPolicy(4, 0.3, 1.5, 12, recover=("clear_backdrop",)),
+    "show": RetryPolicy(2, 1.0, 4.0, 90, recover=("close_modal", "scroll_top")),
+}
+DEFAULT_POLICY = RetryPolicy(3, 0.3, 1.5, 10)
+
+RECOVERY_ACTIONS = {}
+
+
+def register_recovery(name, action):
+    # action(driver); регистрирует модуль, где живёт действие (timeline).
+    RECOVERY_ACTIONS[name] = action
+
+
+class RunDeadlineExceeded(RuntimeError):
+    pass
+
+
+_deadline = None
+
+
+def set_run_deadline(seconds):
+    global _deadline
+    _deadline = time.monotonic() + seconds if seconds else None
+
+
+def check_deadline():
+    if _deadline is not None and time.monotonic() >= _deadline:
+        raise RunDeadlineExceeded("истёк общий лимит времени запуска")
+
+
+def _time_left():
+    return None if _deadline is None else _deadline - time.monotonic()
+
+
+class RetryStats:
+    # Счётчики по шагам для отчёта: вызовы, повторы, исчерпанные попытки, восстановления, время в паузах.
+    FIELDS = ("calls", "retries", "exhausted", "recoveries", "sleep_sec")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.steps = defaultdict(lambda: dict.fromkeys(self.FIELDS, 0))
+
+    def add(self, step, **counts):
+        with self._lock:
+            row = self.steps[step]
+            for name, value in counts.items():
+                row[name] += value
+
+    def snapshot(self):
+        with self._lock:
+            return {step: dict(row, sleep_sec=round(row["sleep_sec"], 2)) for step, row in self.steps.items()}
+
+    def print_report(self):
+        steps = self.snapshot()
+        if not any(row["retries"] or row["exhausted"] for row in steps.values()):
+            return
+        print("\n===== Повторы шагов =====")
+        print(f"{'шаг':<14}{'вызовов':>9}{'повторов':>10}{'исчерпано':>11}{'восст.':>8}{'пауз, с':>9}")
+        for step in sorted(steps):
+            row = steps[step]
+            print(
+                f"{step:<14}{row['calls']:>9}{row['retries']:>10}{row['exhausted']:>11}"
+                f"{row['recoveries']:>8}{row['sleep_sec']:>9.1f}"
+            )
+
+    def write(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+
+
+RETRY_STATS = RetryStats()
+
+
+def recover(step, driver, policy):
+    for name in policy.recover:
+        action = RECOVERY_ACTIONS.get(name)
+        if action is None or driver is None:
+            continue
+        try:
+            action(driver)
+            RETRY_STATS.add(step, recoveries=1)
+        except Exception as e:
+            log.debug(f"Восстановление {name} перед повтором {step} не удалось: {e}")
+
+
+def retry_call(step, func, driver=None, retry_if=None):
+    # func() без аргументов; исключение = неудачная попытка. retry_if(exc) -> False
+    # отдаёт ошибку сразу, без повтора. После последней попытки ошибка пробрасывается.
+    policy = RETRY_POLICIES.get(step, DEFAULT_POLICY)
+    started = time.monotonic()
+    RETRY_STATS.add(step, calls=1)
+    for attempt in range(1, policy.attempts + 1):
+        check_deadline()
+        try:
+            return func()
+        except RunDeadlineExceeded:
+            raise
+        except Exception as e:
+            if retry_if is not None and not retry_if(e):
+                raise
+            delay = policy.delay(attempt)
+            left = _time_left()
+            out_of_budget = time.monotonic() - started + delay > policy.budget_sec
+            if attempt == policy.attempts or out_of_budget or (left is not None and left <= delay):
+                RETRY_STATS.add(step, exhausted=1)
+                raise
+            log.debug(f"Повтор {step} ({attempt}/{policy.attempts}) через {delay:.2f} с: {e}")
+            RETRY_STATS.add(step, retries=1, sleep_sec=delay)
+            recover(step, driver, policy)
+            time.sleep(delay)
@@ -0,0 +1,261 @@
+# Загрузка расписания на один или несколько серверов.
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import logging
+import time
+
+from .api import SmsApiClient, ensure_mock_server
+from .artifacts import capture_failure
+from .backends import ApiBackend, UiBackend
+from .browser import build_chrome_options, close_driver, open_scheduler, start_driver
+from .catalogue import load_show_catalogue
+from .conflicts import print_conflicts, schedule_conflicts, timeline_collisions
+from .config import HEADLESS_WINDOW_SIZE, JOURNAL_PATH, SCHEDULE_BACKEND, SMS_PASSWORD, SMS_USERNAME, SYNC_ENABLED
+from .days import DayColumns
+from .journal import RunJournal
+from .logs import log_context, log_exception
+from .plan import RunPlan, print_day_plan, reconcile_day
+from .retry import RunDeadlineExceeded, check_deadline
+from .targets import schedule_for_target
+from .timeline import verify_click_geometry
+from .tracing import instrument_driver, trace_span
+
+
+log = logging.getLogger(__name__)
+
+
+class DayBatch:
+    # Все размещения одного дня: сначала переносы показов, которые уже стоят
+    # на таймлайне, потом новые. Время дня замеряется для отчёта о скорости.
+    def __init__(self, date):
+        self.date = date
+        self.moves = []
+        self.creates = []
+
+    def __len__(self):
+        return len(self.moves) + len(self.creates)
+
+    def run(self, backend, journal, stats):
+        started = time.monotonic()
+        done = 0
+        for show, block in self.moves:
+            check_deadline()
+            current = backend.current_block(block)
+            if current is None:
+                print(f"⚠️ Блок '{block['title']}' пропал с таймлайна, создаём заново")
+                self.creates.append(show)
+                continue
+            print(f"↪ Переносим фильм: {show['title']} в {show['time']}")
+            if backend.move(show, current, journal):
+                stats["moved"] += 1
+                done += 1
+            else:
+                stats["failed"] += 1
+
+        for show in self.creates:
+            check_deadline()
+            print(f"🎬 Добавляем фильм: {show['title']} в {show['time']}")
+            if backend.create(show, journal):
+                print(f" Фильм добавлен {show['title']} время {show['time']}")
+                stats["added"] += 1
+                done += 1
+            else:
+                stats["failed"] += 1
+
+        seconds = time.monotonic() - started
+        return {
+            "date": self.date,
+            "shows": done,
+            "seconds": round(seconds, 1),
+            "per_minute": round(done * 60 / seconds, 1) if seconds > 0 else 0.0,
+        }
+
+
+def print_day_throughput(day):
+    if day["shows"]:
+        print(
+            f"📈 {day['date']}: {day['shows']} показов за {day['seconds']} с "
+            f"({day['per_minute']} показов/мин, {day['seconds'] / day['shows']:.1f} с на показ)"
+        )
+
+
+def schedule_target(backend, target, plan, journal, resume_states, stats):
+    for date, shows in plan.by_date().items():
+        print(f"\n📅 [{target['name']}] Обрабатываем дату: {date}")
+        with trace_span("date_header", date=date):
+            found = backend.open_day(date, shows[0]["page"])
+
+        if not found:
+            print(f"⚠️ Дата {date} не найдена на странице. Пропускаем.")
+            stats["skipped"] += len(shows)
+            continue
+        log.debug(f"✅ Открыта дата {date}")
+
+        batch = DayBatch(date)
+        # Показы, прерванные посреди добавления, уже есть на таймлайне — их находит сверка.
+        interrupted = any(
+            resume_states.get(journal.show_key(show)) in ("submitted", "created", "moved") for show in shows
+        )
+        if SYNC_ENABLED or interrupted:
+            with trace_span("reconcile", date=date):
+                plan_day = reconcile_day(shows, backend.day_shows())
+            print_day_plan(date, plan_day)
+            placing = plan_day["create"] + [show for show, _ in plan_day["move"]]
+            print_conflicts(target["name"], timeline_collisions(placing, plan_day["extra"], backend.catalogue))
+            for show, _ in plan_day["ok"]:
+                journal.record(show, "confirmed")
+            stats["in_place"] += len(plan_day["ok"])
+            batch.moves = plan_day["move"]
+            batch.creates = plan_day["create"]
+        else:
+            pending = [show for show in shows if resume_states.get(journal.show_key(show)) != "confirmed"]
+            if len(pending) < len(shows):
+                print(f"⏩ Пропускаем {len(shows) - len(pending)} уже подтверждённых показов")
+            stats["in_place"] += len(shows) - len(pending)
+            batch.creates = pending
+
+        if not batch:
+            continue
+        with trace_span("day_batch", date=date, shows=len(batch)):
+            day = batch.run(backend, journal, stats)
+        stats["days"].append(day)
+        print_day_throughput(day)
+
+
+def open_api_session(driver, target):
+    # Сессия из обычного входа в браузере; если сервер держит её не в куках — входим через API.
+    client = SmsApiClient.from_driver(driver, target["url"])
+    if not client.authenticated():
+        client.login(SMS_USERNAME, SMS_PASSWORD)
+        if not client.authenticated():
+            raise RuntimeError("API не принял сессию после входа")
+    print(f"🔌 [{target['name']}] Показы ставим через API, браузер больше не нужен")
+    return client
+
+
+def run_target(target, schedule, run_id, resume, browser, dry_run=False, backend=SCHEDULE_BACKEND):
+    # schedule — список показов или Future с ним: Chrome и вход идут, пока разбирается Excel.
+    with log_context(target=target["name"]):
+        return _run_target(target, schedule, run_id, resume, browser, dry_run, backend)
+
+
+def _run_target(target, schedule, run_id, resume, browser, dry_run, backend):
+    started = time.monotonic()
+    stats = {
+        "target": target["name"],
+        "url": target["url"],
+        "backend": backend,
+        "shows": 0,
+        "added": 0,
+        "moved": 0,
+        "in_place": 0,
+        "skipped": 0,
+        "failed": 0,
+        "planned": 0,
+        "days": [],
+        "error": None,
+    }
+
+    journal = RunJournal(JOURNAL_PATH, run_id, target=target["name"])
+    resume_states = journal.load_states() if resume else {}
+    if resume:
+        confirmed = sum(1 for st in resume_states.values() if st == "confirmed")
+        print(f"⏩ [{target['name']}] Resume: в журнале {confirmed} подтверждённых показов")
+
+    driver = None
+    client = None
+    try:
+        if backend == "api":
+            # До запуска Chrome: запросы API-клиента понимает только mock_server.
+            ensure_mock_server(target["url"])
+        with trace_span("driver_start", target=target["name"]):
+            driver = instrument_driver(start_driver(build_chrome_options(browser, target)))
+        with trace_span("login", target=target["name"]):
+            open_scheduler(driver, target["url"])
+        if backend == "api":
+            client = open_api_session(driver, target)
+            close_driver(driver, browser)
+            driver = None
+        else:
+            verify_click_geometry(driver, HEADLESS_WINDOW_SIZE if browser.get("headless") else None)
+
+        # Каталог не зависит от расписания: читаем его, пока Excel ещё разбирается в фоне.
+        with trace_span("catalogue", target=target["name"]):
+            if client is not None:
+                catalogue = load_show_catalogue(None, target["name"], films=client.catalogue())
+            else:
+                catalogue = load_show_catalogue(driver, target["name"])
+        with trace_span("schedule_wait", target=target["name"]):
+            if isinstance(schedule, Future):
+                schedule = schedule.result()
+            schedule = schedule_for_target(schedule, target)
+        stats["shows"] = len(schedule)
+
+        # Каждый показ разрешаем заранее: дата, фильм из каталога, час и минута пикера.
+        with trace_span("plan", target=target["name"]):
+            # API принимает любую дату — колонки дней нужны только кликам в UI.
+            day_columns = DayColumns(driver) if client is None else None
+            plan = RunPlan.build(target["name"], schedule, day_columns, catalogue)
+        plan.print_report()
+        # Пересечения только показываем: сервер решает сам, но мы узнаём об этом до медленного прогона.
+        conflicts, unknown = schedule_conflicts(plan.entries, catalogue)
+        print_conflicts(target["name"], conflicts, unknown)
+        stats["planned"] = len(plan.entries)
+        for show, kind, reason in plan.failures:
+            stats["skipped" if kind == "date" else "failed"] += 1
+            if not dry_run:
+                journal.record(show, "failed", error=reason)
+
+        if dry_run:
+            print(f"🧪 [{target['name']}] --dry-run: изменения на сервер не вносим")
+        elif client is not None:
+            schedule_target(ApiBackend(client, catalogue), target, plan, journal, resume_states, stats)
+        else:
+            schedule_target(UiBackend(driver, day_columns, catalogue), target, plan, journal, resume_states, stats)
+    except RunDeadlineExceeded as e:
+        # Оставшиеся показы не тронуты: их подхватит следующий запуск с --resume.
+        print(f"⏱️ [{target['name']}] {e}, остановка")
+        stats["error"] = str(e)
+    except Exception as e:
+        log_exception(f"[{target['name']}] Ошибка при работе с сервером {target['url']}")
+        capture_failure(driver, "target", target["name"], e)
+        stats["error"] = str(e)
+    finally:
+        journal.close()
+        if driver is not None:
+            close_driver(driver, browser)
+        if client is not None:
+            client.close()
+
+    stats["seconds"] = round(time.monotonic() - started, 1)
+    return stats
+
+
+def run_targets(targets, schedule, workers, resume, browser, run_id, dry_run=False, backend=SCHEDULE_BACKEND):
+    if len(targets) == 1:
+        return [run_target(targets[0], schedule, run_id, resume, browser, dry_run, backend)]
+
+    # Каждый сервер — в своей сессии Chrome, не больше workers одновременно.
+    summaries = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            pool.submit(run_target, target, schedule, run_id, resume, browser, dry_run, backend)
+            for target in targets
+        ]
+        for future in as_completed(futures):
+            summaries.append(future.result())
+    return sorted(summaries, key=lambda s: s["target"])
+
+
+def print_target_summaries(summaries):
+    print("\n===== Итог по серверам =====")
+    for s in summaries:
+        status = f"❗ {s['error']}" if s["error"] else "✅"
+        print(
+            f"{status} {s['target']} ({s['url']}, {s['backend']}): показов {s['shows']}, в плане {s['planned']}, добавлено {s['added']}, "
+            f"перенесено {s['moved']}, уже на месте {s['in_place']}, пропущено {s['skipped']}, "
+            f"ошибок {s['failed']}, {s['seconds']} с"
+        )
+        for day in s.get("days", []):
+            if day["shows"]:
+                print(f"   {day['date']}: {day['shows']} показов за {day['seconds']} с ({day['per_minute']} показов/мин)")
@@ -0,0 +1,40 @@
+# Серверы Barco SMS (залы) и их доля расписания.
+
+import json
+
+from .config import DEFAULT_BASE_URL
+
+
+def load_targets(args):
+    targets = []
+    if args.targets_file:
+        with open(args.targets_file, "r", encoding="utf-8") as f:
+            for name, url in json.load(f).items():
+                targets.append({"name": name, "url": url.rstrip("/")})
+    for spec in args.target:
+        name, sep, url = spec.partition("=")
+        if not sep:
+            # Указан только URL — имя зала берём из него.
+            name, url = spec, spec
+        targets.append({"name": name.strip(), "url": url.strip().rstrip("/")})
+    if not targets:
+        targets.append({"name": "default", "url": DEFAULT_BASE_URL})
+    return targets
+
+
+def schedule_for_target(schedule, target):
+    # Если в расписании есть залы — серверу достаются только показы его зала.
+    if any("hall" in item for item in schedule):
+        return [item for item in schedule if item.get("hall") == target["name"]]
+    return list(schedule)
+
+
+def hall_target_errors(schedule, targets):
+    # Залы без сервера и серверы без показов: иначе такие показы молча не ставятся никуда.
+    halls = {item["hall"] for item in schedule if "hall" in item}
+    if not halls:
+        return []
+    names = [target["name"] for target in targets]
+    errors = [f"Зал '{hall}' из расписания не совпадает ни с одним сервером" for hall in sorted(halls - set(names))]
+    errors += [f"[{name}] В расписании нет показов этого зала (залы: {', '.join(sorted(halls))})" for name in names if name not in halls]
+    return errors
@@ -0,0 +1,596 @@
+# Действия на таймлайне: клики по слотам, поповер, перенос и проверка показов.
+
+from collections import Counter
+import logging
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from .artifacts import capture_failure
+from .config import PICKER_MINUTE_STEP, SCHEDULE_MODE, STEP_TIMEOUTS, SURE_TITLE_SCORE
+from .dom import catalogue_entry_clicked, dom_click_text_when_ready, dom_query, list_of_shows_populated
+from .logs import log_context, log_exception
+from .network import network_mark, wait_network_idle
+from .plan import picker_minute, show_minutes, show_title_matches
+from .retry import RunDeadlineExceeded, register_recovery, retry_call
+from .titles import title_index_for, titles_match
+from .tracing import trace_span
+from .waits import nth_element_located, wait_step
+
+
+log = logging.getLogger(__name__)
+
+
+# Точка клика внутри dayView: y — отступ от верха колонки. Если точка вне окна
+# (узкий фиксированный viewport, headless), прокручиваем таймлайн к ней.
+_SLOT_POINT_JS = """
+function slotY(day, hour, minute) {
+  const lines = day.querySelectorAll('.hourLine');
+  if (lines.length < 2) return null;
+  const top0 = parseFloat(getComputedStyle(lines[0]).top);
+  const top1 = parseFloat(getComputedStyle(lines[1]).top);
+  const step = (top1 > top0) ? (top1 - top0) : 80;
+  return top0 + (hour * step) + (minute / 60) * step + 2;
+}
+function slotPoint(day, y) {
+  let rect = day.getBoundingClientRect();
+  const x = Math.min(rect.width - 2, Math.max(2, rect.width * 0.6));
+  const clampedY = Math.min(rect.height - 2, Math.max(2, y));
+  const offscreen = () => rect.top + clampedY < 0 || rect.top + clampedY > window.innerHeight;
+  if (offscreen()) {
+    const area = day.closest('.timLineViewArea');
+    if (area) area.scrollTop += rect.top + clampedY - window.innerHeight / 2;
+    rect = day.getBoundingClientRect();
+  }
+  if (offscreen()) {
+    window.scrollBy(0, rect.top + clampedY - window.innerHeight / 2);
+    rect = day.getBoundingClientRect();
+  }
+  return {x, y: clampedY, clientX: rect.left + x, clientY: rect.top + clampedY};
+}
+"""
+
+
+def click_top_slot(driver, day_view):
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", day_view)
+    driver.execute_script(
+        _SLOT_POINT_JS
+        + """
+const day = arguments[0];
+const p = slotPoint(day, 6);
+const target = document.elementFromPoint(p.clientX, p.clientY) || day;
+target.dispatchEvent(new MouseEvent('click', {bubbles: true, cancelable: true, clientX: p.clientX, clientY: p.clientY}));
+""",
+        day_view,
+    )
+
+
+def click_time_slot(driver, day_view, time_str):
+    hour, minute = [int(x) for x in time_str.split(":")]
+
+    def _attempt():
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", day_view)
+        result = driver.execute_script(
+            _SLOT_POINT_JS
+            + """
+const day = arguments[0];
+const y = slotY(day, arguments[1], arguments[2]);
+if (y === null) return {ok:false, reason:'hourLine<2'};
+const p = slotPoint(day, y);
+const target = document.elementFromPoint(p.clientX, p.clientY) || day;
+target.dispatchEvent(new MouseEvent('click', {bubbles: true, cancelable: true, clientX: p.clientX, clientY: p.clientY}));
+return {ok:true, clientX: p.clientX, clientY: p.clientY, x: p.x, y: p.y};
+""",
+            day_view,
+            hour,
+            minute,
+        )
+        if not result or not result.get("ok"):
+            reason = result.get("reason") if isinstance(result, dict) else "unknown"
+            raise RuntimeError(f"JS click failed: {reason}")
+        return result.get("x"), result.get("y")
+
+    try:
+        return retry_call("slot_click", _attempt, driver)
+    except RunDeadlineExceeded:
+        raise
+    except Exception as js_error:
+        log.debug(f"JS-клик по слоту не удался: {js_error}")
+
+    # Last resort: ActionChains if JS failed
+    try:
+        return ActionChains(driver).move_to_element(day_view).click().perform()
+    except Exception as e:
+        raise RuntimeError(f"Click time slot failed after retries: {e}")
+
+
+def verify_click_geometry(driver, window_size=None):
+    # Проверяем, что клики click_time_slot/click_top_slot попадают в колонку дня
+    # при текущем размере окна (важно для headless с фиксированным viewport).
+    issues = driver.execute_script(
+        _SLOT_POINT_JS
+        + """
+const expected = arguments[0];
+const issues = [];
+if (expected && (window.innerWidth < expected[0] - 20 || window.innerHeight < expected[1] - 200)) {
+  issues.push('окно ' + window.innerWidth + 'x' + window.innerHeight + ' меньше ожидаемого ' + expected.join('x'));
+}
+const day = document.querySelector('.dayView');
+if (!day) return issues.concat(['dayView не найден']);
+day.scrollIntoView({block: 'center', inline: 'center'});
+const probes = [[null, 6], [0, 0], [12, 0], [23, 30]];
+for (const [hour, minute] of probes) {
+  const y = hour === null ? minute : slotY(day, hour, minute);
+  if (y === null) { issues.push('hourLine < 2'); break; }
+  const p = slotPoint(day, y);
+  const hit = document.elementFromPoint(p.clientX, p.clientY);
+  const label = hour === null ? 'верхний слот' : (hour + ':' + String(minute).padStart(2, '0'));
+  if (!hit) issues.push(label + ': точка вне окна');
+  else if (!day.contains(hit)) issues.push(label + ': точку перекрывает ' + hit.tagName.toLowerCase() + '.' + (hit.getAttribute('class') || ''));
+}
+return issues;
+""",
+        list(window_size) if window_size else None,
+    )
+    if issues:
+        for issue in issues:
+            print(f"⚠️ Геометрия клика по таймлайну: {issue}")
+    else:
+        log.debug("✅ Геометрия клика по таймлайну проверена")
+    return not issues
+
+
+def _wait_popover(driver, timeout_sec=2):
+    return wait_step(
+        driver,
+        "popover",
+        EC.visibility_of_element_located((By.ID, "showPlaceHolderPopover")),
+        timeout_sec=timeout_sec,
+    )
+
+
+def open_show_popover(driver, day_view, time_str, at_time=False):
+    # at_time=True: сразу кликаем в нужное время, без клика по верхнему слоту.
+    if at_time:
+        slot_clicks = [lambda: click_time_slot(driver, day_view, time_str)]
+    else:
+        slot_clicks = [
+            lambda: click_top_slot(driver, day_view),
+            lambda: click_time_slot(driver, day_view, time_str),
+        ]
+
+    attempts = []
+
+    # Try multiple click strategies to open the popover
+    def _attempt():
+        try:
+            _wait_popover(driver, timeout_sec=0 if not attempts else 1.5)
+            return True
+        except TimeoutException:
+            attempts.append(True)
+
+        for slot_click in slot_clicks:
+            try:
+                slot_click()
+                _wait_popover(driver, timeout_sec=1.5)
+                return True
+            except RunDeadlineExceeded:
+                raise
+            except Exception as e:
+                log.debug(f"Поповер не открылся кликом по слоту: {e}")
+
+        try:
+            placeholder = day_view.find_element(By.CLASS_NAME, "showPlaceHolder")
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", placeholder)
+            try:
+                placeholder.click()
+            except Exception:
+                driver.execute_script("arguments[0].click();", placeholder)
+        except Exception as e:
+            log.debug(f"showPlaceHolder не кликнулся: {e}")
+        raise RuntimeError("поповер не открылся")
+
+    try:
+        return retry_call("popover", _attempt, driver)
+    except RunDeadlineExceeded:
+        raise
+    except Exception:
+        return False
+
+
+def scroll_timeline_to_top(driver):
+    try:
+        driver.execute_script(
+            """
+const area = document.querySelector('.timLineViewArea');
+if (area) { area.scrollTop = 0; }
+window.scrollTo(0, 0);
+"""
+        )
+    except Exception:
+        pass
+
+
+def clear_blocking_modal_backdrop(driver):
+    try:
+        driver.execute_script(
+            """
+document.querySelectorAll('.modal-backdrop').forEach(el => el.remove());
+"""
+        )
+    except Exception:
+        pass
+
+
+def close_datetime_modal(driver):
+    try:
+        # Prefer explicit close controls if available.
+        close_btns = driver.find_elements(By.CSS_SELECTOR, "#dateTimeModal .close, #dateTimeModal [data-dismiss='modal']")
+        for btn in close_btns:
+            try:
+                if btn.is_displayed():
+                    btn.click()
+                    return
+            except Exception:
+                continue
+        # Fallback: ESC key and forced hide.
+        driver.find_element(By.TAG_NAME, "body").send_keys("\uE00C")
+        driver.execute_script(
+            """
+const modal = document.getElementById('dateTimeModal');
+if (modal) {
+  modal.classList.remove('in');
+  modal.style.display = 'none';
+}
+"""
+        )
+    except Exception:
+        pass
+    clear_blocking_modal_backdrop(driver)
+
+
+# Время начала показа: из текста блока, иначе по его положению между hourLine.
+_BLOCK_MINUTES_JS = """
+function blockMinutes(day, block) {
+  const m = (block.innerText || '').match(/(\\d{1,2}):(\\d{2})/);
+  if (m) return parseInt(m[1], 10) * 60 + parseInt(m[2], 10);
+  const lines = day.querySelectorAll('.hourLine');
+  if (lines.length < 2) return null;
+  const top0 = parseFloat(getComputedStyle(lines[0]).top);
+  const top1 = parseFloat(getComputedStyle(lines[1]).top);
+  const step = (top1 > top0) ? (top1 - top0) : 80;
+  const y = block.getBoundingClientRect().top - day.getBoundingClientRect().top;
+  return Math.round((y - top0) / step * 60);
+}
+"""
+
+
+def read_day_shows(driver, day_view):
+    # Все показы дня (название + время начала) за один вызов.
+    return driver.execute_script(
+        _BLOCK_MINUTES_JS
+        + """
+const day = arguments[0];
+return Array.from(day.querySelectorAll('.rowItem')).map((el, i) => {
+  const title = el.querySelector('.title') || el;
+  return {index: i, title: (title.innerText || '').trim(), minutes: blockMinutes(day, el), el: el};
+});
+""",
+        day_view,
+    )
+
+
+def find_day_show(driver, day_view, title, minutes):
+    for block in read_day_shows(driver, day_view):
+        if block["title"] == title and block["minutes"] == minutes:
+            return block
+    return None
+
+
+def day_show_counts(driver, day_view):
+    # Снимок дня до создания показа: (название, время) -> сколько таких блоков.
+    return Counter((block["title"], block["minutes"]) for block in read_day_shows(driver, day_view))
+
+
+def new_day_show(day_view, before, title_matches):
+    # Таймлайн перерисовывается целиком, поэтому новый блок — тот, которого нет в снимке before.
+    def _condition(driver):
+        seen = Counter()
+        for block in read_day_shows(driver, day_view):
+            key = (block["title"], block["minutes"])
+            seen[key] += 1
+            if seen[key] > before[key] and title_matches(block["title"]):
+                return block
+        return False
+
+    return _condition
+
+
+def open_popover_at_fixed_slot(driver, day_view):
+    hour_line = wait_step(driver, "hour_line", nth_element_located((By.CLASS_NAME, "hourLine"), 5, root=day_view))
+    hour_line.click()
+    _wait_popover(driver, timeout_sec=STEP_TIMEOUTS["popover"])
+
+
+def select_film_in_popover(driver, movie_name, catalogue=None, match=None, journal=None, show=None):
+    wait_step(driver, "caret", EC.element_to_be_clickable((By.CLASS_NAME, "caretBtn"))).click()
+    log.debug("Клик по кнопке произошел")
+
+    clicked = False
+    if catalogue is not None and len(catalogue):
+        # Фильм уже найден в каталоге — в UI только кликаем нужную строку.
+        match = match or catalogue.match(movie_name)
+        if match["index"] is not None and match["score"] >= SURE_TITLE_SCORE:
+            result = wait_step(
+                driver, "list_of_shows", catalogue_entry_clicked(match["index"], match["title"], len(catalogue))
+            )
+            clicked = result.get("clicked", False)
+            if not clicked:
+                print(f"♻️ listOfShows изменился ({result.get('count')} вместо {len(catalogue)}), перечитываем")
+
+    if not clicked:
+        rows = wait_step(driver, "list_of_shows", list_of_shows_populated)
+        titles = [row["text"] for row in rows]
+        if catalogue is not None:
+            catalogue.refresh(titles)
+            match = catalogue.match(movie_name)
+        else:
+            match = title_index_for(titles).match(movie_name)
+        if match["index"] is None:
+            raise RuntimeError(f"Фильм '{movie_name}' не найден в списке listOfShows")
+        if match["score"] < SURE_TITLE_SCORE:
+            raise RuntimeError(f"Фильма '{movie_name}' нет в listOfShows, есть только похожий '{match['title']}'")
+        # Нашли фильм в списке выбрали его
+        if not dom_query(driver, "click", "#listOfShows", "a", rows[match["index"]]["index"]):
+            raise RuntimeError(f"Фильм '{movie_name}' не найден в списке listOfShows")
+
+    print(f"🎬 Найден фильм в списке {match['title']} наименование в exel {movie_name} (score={match['score']:.2f})")
+    if match["ambiguous"]:
+        print(f"⚠️ Похожие названия в списке: {match['ambiguous']}")
+    if journal:
+        # После OK сервер может сохранить показ, даже если блок на таймлайне не дождёмся.
+        journal.record(show, "submitted")
+    mark = network_mark(driver)
+    wait_step(
+        driver,
+        "popover_ok",
+        EC.element_to_be_clickable((By.CSS_SELECTOR, "#showPlaceHolderPopover .ok")),
+    ).click()
+    wait_network_idle(driver, "network_popover_ok", mark)
+    return match
+
+
+def open_move_dialog(driver, block):
+    # Клики меню повторяются: их перехватывает фон только что закрытой модалки (clear_backdrop).
+    def _open_menu():
+        block.click()
+        wait_step(driver, "menu_show", EC.element_to_be_clickable((By.ID, "menuShow"))).click()
+
+    def _move_to():
+        retry_call("menu_show", _open_menu, driver)
+        wait_step(driver, "move_to", EC.element_to_be_clickable((By.ID, "moveTo"))).click()
+
+    retry_call("move_to", _move_to, driver)
+    wait_step(driver, "datepicker", EC.visibility_of_element_located((By.CLASS_NAME, "datepicker-days")))
+
+
+# Вся модалка переноса одним вызовом: день — только если он ещё не выбран,
+# час и минута — кликом сразу по ячейке, без открытия сетки, если значение уже стоит.
+# null, пока модалка не дорисована; иначе что в итоге показывает пикер.
+_MOVE_DATETIME_JS = """
+const [day, hour, minute] = arguments;
+const modal = document.getElementById('dateTimeModal') || document;
+const text = (el) => (el ? (el.innerText || el.textContent || '').trim() : '');
+const same = (el, value) => el && Number(text(el)) === Number(value);
+const cell = (selector, value, skipClass) => Array.from(modal.querySelectorAll(selector))
+  .find((el) => same(el, value) && !(skipClass && el.classList.contains(skipClass)));
+const hourLabel = () => modal.querySelector('.timepicker-hour');
+const minuteLabel = () => modal.querySelector('.timepicker-minute');
+if (!hourLabel() || !minuteLabel() || !modal.querySelector('.datepicker-days .day')) return null;
+
+const result = {day: 'active'};
+if (!same(modal.querySelector('.datepicker-days .day.active'), day)) {
+  const dayCell = cell('.datepicker-days .day', day, 'notSelectable');
+  if (!dayCell) return {day: 'missing'};
+  dayCell.click();
+  result.day = 'clicked';
+}
+// Сетку открываем, только если нужная ячейка есть: иначе пикер остаётся как был для запасного пути.
+if (!same(hourLabel(), hour) && cell('.hour', hour)) {
+  hourLabel().click();
+  cell('.hour', hour).click();
+}
+if (!same(minuteLabel(), minute) && cell('.minute', minute)) {
+  minuteLabel().click();
+  cell('.minute', minute).click();
+}
+result.hour = text(hourLabel());
+result.minute = text(minuteLabel());
+return result;
+"""
+
+
+def move_datetime_set(day, hour, minute):
+    def _condition(driver):
+        return driver.execute_script(_MOVE_DATETIME_JS, day, hour, minute) or False
+
+    return _condition
+
+
+def set_move_datetime(driver, entry):
+    # Быстрый путь; пошаговый pick_time и increment/decrement — только если пикер не встал.
+    result = wait_step(driver, "datepicker", move_datetime_set(entry["day"], entry["hour"], entry["minute"]))
+    if result["day"] == "missing":
+        print(f"⚠️ День {entry['day']} не найден в календаре")
+        return
+    log.debug(f"День {entry['day']}: {result['day']}, пикер {result['hour']}:{result['minute']}")
+    if not result["hour"].isdigit() or int(result["hour"]) != int(entry["hour"]):
+        print(f"⚠️ Час {entry['hour']} не выставился одним вызовом, выбираем по шагам")
+        pick_time(driver, entry["hour"], entry["minute"])
+    elif not result["minute"].isdigit() or int(result["minute"]) != entry["minute"]:
+        print(f"Не нашли минуту {entry['minute']:02d} в списке, пробуем через increment/decrement")
+        step_minutes(driver, entry["minute"])
+
+
+def pick_time(driver, hour_time, minuts_time):
+    wait_step(driver, "timepicker", EC.element_to_be_clickable((By.CLASS_NAME, "timepicker-hour"))).click()
+    hour_click = wait_step(driver, "timepicker", dom_click_text_when_ready(".timepicker", ".hour", hour_time))
+    if not hour_click.get("found"):
+        print(f"⚠️ Час {hour_time} не найден в timepicker")
+
+    rounded_minute = picker_minute(minuts_time)
+    rounded_minute_str = f"{rounded_minute:02d}"
+    log.debug(f"Минуты из Excel: {minuts_time}, ставим: {rounded_minute_str}")
+
+    wait_step(driver, "timepicker", EC.element_to_be_clickable((By.CLASS_NAME, "timepicker-minute"))).click()
+    minute_click = wait_step(driver, "timepicker", dom_click_text_when_ready(None, ".minute", rounded_minute_str))
+    minute_selected = minute_click.get("found")
+
+    if not minute_selected:
+        print(f"Не нашли минуту {rounded_minute_str} в списке, пробуем через increment/decrement")
+        step_minutes(driver, rounded_minute)
+
+
+def step_minutes(driver, rounded_minute):
+    rounded_minute_str = f"{rounded_minute:02d}"
+    for _ in range(25):
+        current_min = driver.find_element(By.CLASS_NAME, "timepicker-minute").text.strip()
+        if current_min == rounded_minute_str:
+            return True
+        if int(current_min) < rounded_minute:
+            driver.find_element(By.CSS_SELECTOR, "[data-action='incrementMinutes']").click()
+        else:
+            driver.find_element(By.CSS_SELECTOR, "[data-action='decrementMinutes']").click()
+        time.sleep(0.1)
+    return False
+
+
+def confirm_move(driver):
+    # Сохраняем рассписание
+    mark = network_mark(driver)
+    wait_step(driver, "confirm", EC.element_to_be_clickable((By.ID, "confirmDateTimeBtn"))).click()
+    wait_network_idle(driver, "network_confirm", mark)
+    # Ждём, пока сервер сохранит показ и модалка закроется.
+    wait_step(driver, "modal_closed", EC.invisibility_of_element_located((By.ID, "dateTimeModal")))
+
+
+def move_show_block(driver, block, entry):
+    # entry — показ из плана: день, час и минута пикера уже посчитаны.
+    with trace_span("move_dialog"):
+        open_move_dialog(driver, block)
+    with trace_span("picker"):
+        set_move_datetime(driver, entry)
+    with trace_span("confirm"):
+        confirm_move(driver)
+
+
+def add_show_via_move(driver, day_view, show, journal=None, catalogue=None):
+    # Старый путь: создаём показ в фиксированном слоте и переносим через moveTo.
+    movie_name = show["title"].strip().lower()
+    before = day_show_counts(driver, day_view)
+    with trace_span("popover"):
+        open_popover_at_fixed_slot(driver, day_view)
+    with trace_span("list_selection"):
+        match = select_film_in_popover(driver, movie_name, catalogue, show.get("match"), journal, show)
+
+    # Ищем фильм для перемещения
+    block = wait_step(driver, "row_item", new_day_show(day_view, before, lambda title: titles_match(match["title"], title)))
+    if journal:
+        journal.record(show, "created")
+    move_show_block(driver, block["el"], show)
+    if journal:
+        journal.record(show, "moved")
+
+
+def add_show_direct(driver, day_view, show, journal=None, catalogue=None):
+    # Создаём показ сразу в нужное время; moveTo только если промахнулись.
+    movie_name = show["title"].strip().lower()
+    hour_time, minuts_time = show["time"].split(":")
+    target_minutes = int(hour_time) * 60 + int(minuts_time)
+
+    before = day_show_counts(driver, day_view)
+    scroll_timeline_to_top(driver)
+    with trace_span("popover"):
+        if not open_show_popover(driver, day_view, show["time"], at_time=True):
+            print("⚠️ Поповер не открылся по клику во время, создаём в фиксированном слоте")
+            open_popover_at_fixed_slot(driver, day_view)
+    with trace_span("list_selection"):
+        match = select_film_in_popover(driver, movie_name, catalogue, show.get("match"), journal, show)
+
+    block = wait_step(driver, "row_item", new_day_show(day_view, before, lambda title: titles_match(match["title"], title)))
+    if journal:
+        journal.record(show, "created")
+    placed_minutes = block["minutes"]
+    if placed_minutes is not None and abs(placed_minutes - target_minutes) <= PICKER_MINUTE_STEP:
+        print(f"✅ Показ встал сразу в нужное время ({placed_minutes // 60:02d}:{placed_minutes % 60:02d})")
+        return
+
+    print(f"Показ встал в {placed_minutes} мин. вместо {target_minutes}, переносим через moveTo")
+    move_show_block(driver, block["el"], show)
+    if journal:
+        journal.record(show, "moved")
+
+
+def show_is_placed(driver, day_view, show):
+    target = show_minutes(show)
+    for block in read_day_shows(driver, day_view):
+        if block["minutes"] is None or abs(block["minutes"] - target) > PICKER_MINUTE_STEP:
+            continue
+        if show_title_matches(show, block["title"]):
+            return True
+    return False
+
+
+def schedule_show(driver, journal, found_index, show, block=None, catalogue=None):
+    # block: показ, который уже стоит на таймлайне и его нужно только перенести.
+    key = journal.show_key(show)
+
+    # Показ целиком повторяем, только пока OK в поповере не нажат и показ не перенесён:
+    # иначе второй заход поставил бы дубль на таймлайн.
+    def _not_saved_yet(_):
+        return journal.last_state.get(key) not in ("submitted", "created", "moved")
+
+    with log_context(show=key):
+        with trace_span("show", title=show["title"], date=show["date"], time=show["time"]):
+            try:
+                retry_call(
+                    "show",
+                    lambda: _schedule_show(driver, journal, found_index, show, block, catalogue),
+                    driver,
+                    retry_if=_not_saved_yet,
+                )
+                return True
+            except RunDeadlineExceeded:
+                raise
+            except Exception as e:
+                log_exception(f"Ошибка при добавлении фильма '{show['title']}' {show['date']} {show['time']}")
+                capture_failure(driver, "show", key, e)
+                journal.record(show, "failed", error=str(e))
+                close_datetime_modal(driver)
+                return False
+
+
+def _schedule_show(driver, journal, found_index, show, block, catalogue):
+    if block is not None:
+        move_show_block(driver, block, show)
+        journal.record(show, "moved")
+    else:
+        day_view = wait_step(driver, "day_view", nth_element_located((By.CLASS_NAME, "dayView"), found_index))
+        if SCHEDULE_MODE == "move":
+            add_show_via_move(driver, day_view, show, journal, catalogue)
+        else:
+            add_show_direct(driver, day_view, show, journal, catalogue)
+
+    day_view = wait_step(driver, "day_view", nth_element_located((By.CLASS_NAME, "dayView"), found_index))
+    if not show_is_placed(driver, day_view, show):
+        raise RuntimeError("после сохранения показ не найден на таймлайне в нужное время")
+    journal.record(show, "confirmed")
+
+
+# Действия, которые retry выполняет между попытками шагов (см. RETRY_POLICIES).
+register_recovery("clear_backdrop", clear_blocking_modal_backdrop)
+register_recovery("close_modal", close_datetime_modal)
+register_recovery("scroll_top", scroll_timeline_to_top)
@@ -0,0 +1,145 @@
+# Сравнение названий фильмов из Excel и из списка Barco.
+
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+import re
+
+from .config import MIN_TITLE_SCORE
+
+
+def normalize_title(text):
+    if text is None:
+        return ""
+    t = text.lower()
+    t = re.sub(r"[^a-zа-я0-9\s]+", " ", t, flags=re.IGNORECASE)
+    t = re.sub(r"\s+", " ", t).strip()
+    return t
+
+
+def titles_match(expected, actual):
+    e = normalize_title(expected)
+    a = normalize_title(actual)
+    if not e or not a:
+        return False
+    if e in a or a in e:
+        return True
+    # Require shared words when exact contains check fails.
+    e_words = [w for w in e.split() if len(w) > 2]
+    a_words = [w for w in a.split() if len(w) > 2]
+    common = set(e_words) & set(a_words)
+    if e_words and len(common) >= max(1, len(e_words) - 1):
+        return True
+    # Try dropping last letter in last word (Ушаков/Ушакова)
+    e_parts = e.split()
+    if e_parts:
+        e_last = e_parts[-1]
+        if len(e_last) > 3:
+            e_parts[-1] = e_last[:-1]
+            e2 = " ".join(e_parts)
+            if e2 in a:
+                return True
+    return False
+
+
+def _title_words(normalized):
+    return {w for w in normalized.split() if len(w) > 2}
+
+
+def _title_keys(normalized):
+    # Ключи инвертированного индекса: слова и их основа без последней буквы (Ушаков/Ушакова).
+    keys = set()
+    for word in _title_words(normalized):
+        keys.add(word)
+        if len(word) > 3:
+            keys.add(word[:-1])
+    return keys
+
+
+class TitleIndex:
+    # Индекс названий из listOfShows: каждое название нормализуется один раз,
+    # запрос сравнивается только с кандидатами, у которых есть общие слова.
+    AMBIGUITY_MARGIN = 0.05
+    MAX_CANDIDATES = 50
+
+    def __init__(self, titles):
+        self.titles = list(titles)
+        self.normalized = [normalize_title(t) for t in self.titles]
+        self.words = [_title_words(n) for n in self.normalized]
+        self.exact = {}
+        self.postings = defaultdict(set)
+        for i, norm in enumerate(self.normalized):
+            if not norm:
+                continue
+            self.exact.setdefault(norm, i)
+            for key in _title_keys(norm):
+                self.postings[key].add(i)
+
+    def __len__(self):
+        return len(self.titles)
+
+    def _candidates(self, norm):
+        keys = _title_keys(norm)
+        if not keys:
+            # Одни короткие слова — индекс не поможет, сравниваем со всеми.
+            return range(len(self.titles))
+        # Дорогое сравнение строк — только для тех, у кого больше всего общих слов.
+        hits = Counter()
+        for key in keys:
+            hits.update(self.postings.get(key, ()))
+        return [i for i, _ in hits.most_common(self.MAX_CANDIDATES)]
+
+    def _score(self, norm, words, trimmed, i):
+        a = self.normalized[i]
+        if not a:
+            return 0.0
+        if norm in a or a in norm:
+            return 1.0
+        if trimmed and trimmed in a:
+            return 0.95
+        overlap = len(words & self.words[i]) / len(words) if words else 0.0
+        return max(overlap, SequenceMatcher(None, norm, a).ratio())
+
+    def match(self, title, min_score=MIN_TITLE_SCORE):
+        # Результат: index/title лучшего совпадения (None, если ниже min_score),
+        # score и ambiguous — другие названия почти с тем же счётом.
+        norm = normalize_title(title)
+        result = {"query": title, "index": None, "title": None, "score": 0.0, "ambiguous": []}
+        if not norm:
+            return result
+        if norm in self.exact:
+            i = self.exact[norm]
+            result.update(index=i, title=self.titles[i], score=1.0)
+            return result
+
+        words = _title_words(norm)
+        parts = norm.split()
+        trimmed = " ".join(parts[:-1] + [parts[-1][:-1]]) if len(parts[-1]) > 3 else None
+        scored = []
+        for i in self._candidates(norm):
+            score = self._score(norm, words, trimmed, i)
+            if score >= min_score:
+                # При равном счёте ближе то название, что короче отличается по длине, затем — первое в списке.
+                scored.append((score, -abs(len(self.normalized[i]) - len(norm)), i))
+        if not scored:
+            return result
+        scored.sort(key=lambda item: (-item[0], -item[1], item[2]))
+        best_score, _, best = scored[0]
+        result.update(index=best, title=self.titles[best], score=round(best_score, 3))
+        result["ambiguous"] = [
+            self.titles[i] for score, _, i in scored[1:] if score >= best_score - self.AMBIGUITY_MARGIN
+        ]
+        return result
+
+
+_title_index_cache = {}
+
+
+def title_index_for(titles):
+    # Один индекс на содержимое списка: пока listOfShows не меняется, индекс переиспользуется.
+    key = tuple(titles)
+    index = _title_index_cache.get(key)
+    if index is None:
+        if len(_title_index_cache) > 8:
+            _title_index_cache.clear()
+        index = _title_index_cache[key] = TitleIndex(titles)
+    return index
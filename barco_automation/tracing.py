@@ -0,0 +1,130 @@
+# Замеры фаз запуска и счётчик вызовов WebDriver.
+
+from collections import defaultdict
+from contextlib import contextmanager
+import json
+import math
+import threading
+import time
+
+from .logs import log_context
+
+
+class RunTracer:
+    # Замеры фаз: монотонное время и число вызовов WebDriver на поток.
+    def __init__(self, run_id, path):
+        self.run_id = run_id
+        self.path = path
+        self.durations = defaultdict(list)
+        self.calls = defaultdict(int)
+        # Все вызовы WebDriver по потокам, в том числе вне фаз: фазы вложены и их сумма врёт.
+        self.thread_calls = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("a", encoding="utf-8")
+
+    def webdriver_calls(self):
+        return getattr(self._local, "calls", 0)
+
+    def count_webdriver_call(self):
+        calls = self.webdriver_calls() + 1
+        self._local.calls = calls
+        self.thread_calls[threading.current_thread()] = calls
+
+    def total_webdriver_calls(self):
+        with self._lock:
+            return sum(self.thread_calls.values())
+
+    @contextmanager
+    def span(self, phase, **attrs):
+        started = time.perf_counter()
+        calls_before = self.webdriver_calls()
+        error = None
+        try:
+            with log_context(phase=phase):
+                yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            seconds = time.perf_counter() - started
+            calls = self.webdriver_calls() - calls_before
+            record = {
+                "run_id": self.run_id,
+                "thread": threading.current_thread().name,
+                "phase": phase,
+                "seconds": round(seconds, 4),
+                "webdriver_calls": calls,
+                "error": error,
+            }
+            record.update(attrs)
+            with self._lock:
+                self.durations[phase].append(seconds)
+                self.calls[phase] += calls
+                self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def summary(self):
+        with self._lock:
+            return {
+                phase: {
+                    "count": len(values),
+                    "p50": round(percentile(values, 50), 3),
+                    "p95": round(percentile(values, 95), 3),
+                    "total": round(sum(values), 3),
+                    "webdriver_calls": self.calls[phase],
+                }
+                for phase, values in self.durations.items()
+            }
+
+    def print_summary(self):
+        summary = self.summary()
+        print("\n===== Профиль запуска (сек) =====")
+        print(f"{'фаза':<16}{'N':>6}{'p50':>9}{'p95':>9}{'всего':>10}{'WD':>8}")
+        for phase, row in sorted(summary.items(), key=lambda item: -item[1]["total"]):
+            print(
+                f"{phase:<16}{row['count']:>6}{row['p50']:>9.3f}{row['p95']:>9.3f}"
+                f"{row['total']:>10.2f}{row['webdriver_calls']:>8}"
+            )
+        total = self.total_webdriver_calls()
+        print(f"{'всего WebDriver':<50}{total:>8}")
+        with open(self.path.with_name(f"summary_{self.run_id}.json"), "w", encoding="utf-8") as f:
+            json.dump({"phases": summary, "webdriver_calls": total}, f, ensure_ascii=False, indent=2)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    # Метод ближайшего ранга.
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+# Трассировщик текущего запуска; None — замеры выключены.
+TRACER = None
+
+
+def trace_span(phase, **attrs):
+    # Фаза попадает и в трассировку, и в контекст записей журнала.
+    if TRACER is None:
+        return log_context(phase=phase)
+    return TRACER.span(phase, **attrs)
+
+
+def instrument_driver(driver):
+    # Все команды WebDriver (и у элементов тоже) проходят через driver.execute.
+    if TRACER is None:
+        return driver
+    execute = driver.execute
+
+    def counted_execute(driver_command, params=None):
+        TRACER.count_webdriver_call()
+        return execute(driver_command, params)
+
+    driver.execute = counted_execute
+    return driver
@@ -0,0 +1,39 @@
+# Ожидания шагов UI на WebDriverWait.
+
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .config import DEFAULT_STEP_TIMEOUT, SETTLE_DELAY_SEC, STEP_POLL_SEC, STEP_TIMEOUTS
+
+
+def settle():
+    if SETTLE_DELAY_SEC > 0:
+        time.sleep(SETTLE_DELAY_SEC)
+
+
+def wait_step(driver, step, condition, timeout_sec=None):
+    timeout = timeout_sec if timeout_sec is not None else STEP_TIMEOUTS.get(step, DEFAULT_STEP_TIMEOUT)
+    try:
+        result = WebDriverWait(
+            driver,
+            timeout,
+            poll_frequency=STEP_POLL_SEC,
+            ignored_exceptions=(StaleElementReferenceException,),
+        ).until(condition)
+    except TimeoutException:
+        raise TimeoutException(f"Шаг '{step}' не дождался условия за {timeout} с")
+    settle()
+    return result
+
+
+def nth_element_located(locator, index, root=None):
+    def _condition(driver):
+        elements = (root or driver).find_elements(*locator)
+        if index < len(elements):
+            return elements[index]
+        return False
+
+    return _condition
+
@@ -0,0 +1,9 @@
+# Бенчмарк переехал в barco_automation/bench.py (python -m barco_automation bench).
+
+import sys
+
+from barco_automation.bench import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+# Заглушка переехала в barco_automation/mock_server.py.
+
+import sys
+
+from barco_automation.mock_server import main, start_mock_server, synthetic_films  # noqa: F401
+
+
+if __name__ == "__main__":
+    sys.exit(main())
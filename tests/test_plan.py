@@ -0,0 +1,53 @@
+from barco_automation.catalogue import ShowCatalogue
+from barco_automation.plan import RunPlan, reconcile_day
+
+
+def entry(title, time, match_title=None):
+    match = {"title": match_title, "index": 0, "score": 1.0, "ambiguous": []} if match_title else None
+    return {"date": "01.03.2026", "time": time, "title": title, "match": match}
+
+
+def block(title, minutes):
+    return {"title": title, "minutes": minutes}
+
+
+def test_sequel_on_timeline_is_not_in_place():
+    show = entry("Дюна: Часть вторая", "10:00", "Дюна: Часть вторая")
+    plan = reconcile_day([show], [block("Дюна: Часть первая", 600)])
+    assert plan["ok"] == []
+    assert plan["move"] == []
+    assert plan["create"] == [show]
+
+
+def test_shared_word_film_is_not_moved():
+    show = entry("Мастер и Маргарита", "18:00", "Мастер и Маргарита")
+    other = block("Мастер спорта", 600)
+    plan = reconcile_day([show], [other])
+    assert plan["move"] == []
+    assert plan["create"] == [show]
+    assert plan["extra"] == [other]
+
+
+def test_catalogue_title_matches_timeline_block():
+    show = entry("Мастер и Маргарита, 18+", "18:00", "Мастер и Маргарита")
+    placed = block("Мастер и Маргарита", 1080)
+    moved = block("Мастер и Маргарита", 600)
+    plan = reconcile_day([show, dict(show, time="21:00")], [placed, moved])
+    assert plan["ok"] == [(show, placed)]
+    assert [b for _, b in plan["move"]] == [moved]
+
+
+def test_similar_catalogue_title_is_a_plan_failure():
+    catalogue = ShowCatalogue("Зал 1", ["Мастер спорта", "Дюна: Часть вторая"])
+    shows = [entry("Мастер и Маргарита", "10:00"), entry("Дюна: Часть вторая 2D", "13:00")]
+    plan = RunPlan.build("Зал 1", shows, catalogue=catalogue)
+    assert [e["match"]["title"] for e in plan.entries] == ["Дюна: Часть вторая"]
+    assert [(show["title"], kind) for show, kind, _ in plan.failures] == [("Мастер и Маргарита", "title")]
+
+
+def test_stale_catalogue_does_not_reject_titles():
+    catalogue = ShowCatalogue("Зал 1", ["Дюна: Часть вторая"])
+    catalogue.stale = True
+    plan = RunPlan.build("Зал 1", [entry("Новый фильм", "10:00")], catalogue=catalogue)
+    assert plan.failures == []
+    assert plan.entries[0]["match"] is None